@@ -25,14 +25,18 @@ Version: 3.0 Trust-Enabled
 """
 
 import tweepy
+import contextlib
+import functools
 import time
 import os
 import json
 import logging
+import re
 import sys
 import traceback
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 # Add trust_system to path
@@ -68,10 +72,22 @@ YOUR_USER_ID = os.getenv("YOUR_SATYVM_USER_ID")
 
 # Search and analysis configuration
 MENTION_TRIGGER = "@satyvm acc"
-LAST_SEEN_ID_FILE = "last_seen_id.txt"
 API_USAGE_FILE = "api_usage_trust_enabled.json"
+LAST_SEEN_ID_FILE = "last_seen_id.txt"  # Mention cursor shared with main.py and main_enhanced.py
 MAX_API_CALLS_PER_SESSION = 15  # Increased for trust validation
 MIN_TRUSTED_FOLLOWERS = 2  # Minimum trusted followers for validation
+MAX_PACING_DELAY = 5.0  # Cap between mentions; exhausted windows are left to wait_on_rate_limit
+MENTION_ANALYSIS_ENDPOINT = "/2/users/:id/tweets"  # First call made for each analyzed mention
+_ENDPOINT_ID_RE = re.compile(r'(?<=\w)/\d+(?=/|$)')  # Numeric path IDs, not the leading /2 version
+
+# Monthly call thresholds -> efficiency rating (ascending)
+EFFICIENCY_RATINGS = (
+    (20, "Excellent"),
+    (35, "Very Good"),
+    (50, "Good"),
+    (55, "Fair"),
+    (float('inf'), "Poor"),
+)
 
 # Feature flags
 DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
@@ -79,6 +95,60 @@ TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"
 DEEP_ANALYSIS = os.getenv("DEEP_ANALYSIS", "true").lower() == "true"
 TRUST_VALIDATION = os.getenv("TRUST_VALIDATION", "true").lower() == "true"
 
+# --- Test mode fixtures ---
+class _MockMention:
+    def __init__(self):
+        self.id = "1234567890123456789"
+        self.text = "Impressive blockchain security research! @satyvm acc what's your analysis of this new DeFi protocol's smart contract architecture?"
+        self.author_id = "987654321098765432"
+        self.in_reply_to_user_id = "555666777888999000"
+        self.created_at = datetime(2025, 6, 8, tzinfo=timezone.utc)
+
+class _MockUser:
+    def __init__(self, user_type="target"):
+        if user_type == "target":
+            self.id = "555666777888999000"
+            self.username = "defi_security_expert"
+            self.name = "Alex Chen | DeFi Security Researcher"
+            self.description = "🔐 Lead Security Researcher @trailofbits | Smart Contract Auditor | DeFi Protocol Advisor | Previously @consensys | Building safer Web3 | alex.eth"
+            self.location = "San Francisco, CA"
+            self.url = "https://alexchen.security"
+            self.profile_image_url = "https://example.com/alex_avatar.jpg"
+            self.created_at = datetime(2018, 11, 20, tzinfo=timezone.utc)
+            self.verified = True
+            self.verified_type = "blue"
+            self.protected = False
+            self.public_metrics = {
+                'followers_count': 15420,
+                'following_count': 892,
+                'tweet_count': 3247,
+                'listed_count': 189
+            }
+        else:
+            self.id = "987654321098765432"
+            self.username = "crypto_enthusiast"
+            self.name = "Crypto Enthusiast"
+            self.description = "Web3 builder and DeFi researcher"
+            self.location = "Remote"
+            self.created_at = datetime(2021, 5, 1, tzinfo=timezone.utc)
+            self.verified = False
+            self.protected = False
+            self.public_metrics = {
+                'followers_count': 823,
+                'following_count': 1240,
+                'tweet_count': 1456,
+                'listed_count': 12
+            }
+
+@functools.lru_cache(maxsize=1)
+def _build_test_mentions():
+    """Build the test-mode mention fixtures once per process"""
+    mock_mention = _MockMention()
+    mock_replier = _MockUser("replier")
+    mock_target = _MockUser("target")
+    mock_includes = {'users': [mock_replier, mock_target]}
+    return [(mock_mention, mock_includes)]
+
 class TrustEnabledAPITracker:
     """Enhanced API usage tracker with trust validation support"""
     
@@ -88,6 +158,7 @@ class TrustEnabledAPITracker:
         self.trust_calls = 0
         self.analysis_calls = 0
         self.session_details = []
+        self.rate_limits = {}
         self.load_usage_data()
     
     def load_usage_data(self):
@@ -152,27 +223,58 @@ class TrustEnabledAPITracker:
         return self.session_calls < MAX_API_CALLS_PER_SESSION
     
     def save_usage_data(self):
-        """Save enhanced usage data"""
+        """Save enhanced usage data atomically via a temp file and os.replace"""
+        tmp_file = self.usage_file + '.tmp'
         try:
-            if self.session_details:
-                session_summary = {
-                    "start_time": self.session_details[0]["timestamp"],
-                    "end_time": self.session_details[-1]["timestamp"],
-                    "total_calls": self.session_calls,
-                    "trust_calls": self.trust_calls,
-                    "analysis_calls": self.analysis_calls,
-                    "calls": self.session_details.copy()
-                }
-                
-                if "sessions" not in self.usage_data:
-                    self.usage_data["sessions"] = []
-                self.usage_data["sessions"].append(session_summary)
-                self.usage_data["sessions"] = self.usage_data["sessions"][-50:]
-            
-            with open(self.usage_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(self.usage_data, f, indent=2)
+            os.replace(tmp_file, self.usage_file)
         except Exception as e:
             logger.error(f"❌ Error saving API usage data: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+    
+    def finalize_session(self):
+        """Append the session summary once at session end and save"""
+        if not self.session_details:
+            return
+        
+        session_summary = {
+            "start_time": self.session_details[0]["timestamp"],
+            "end_time": self.session_details[-1]["timestamp"],
+            "total_calls": self.session_calls,
+            "trust_calls": self.trust_calls,
+            "analysis_calls": self.analysis_calls,
+            "calls": self.session_details.copy()
+        }
+        
+        self.usage_data["sessions"] = self.usage_data.get("sessions", [])[-49:] + [session_summary]
+        self.save_usage_data()
+    
+    def capture_rate_limit_headers(self, response, *args, **kwargs):
+        """requests response hook - keep rate limit headers per endpoint"""
+        if 'x-rate-limit-remaining' in response.headers:
+            endpoint = _ENDPOINT_ID_RE.sub('/:id', urlsplit(response.url).path)
+            self.rate_limits[endpoint] = {
+                'remaining': response.headers.get('x-rate-limit-remaining'),
+                'reset': response.headers.get('x-rate-limit-reset')
+            }
+        return response
+    
+    def get_pacing_delay(self, endpoint):
+        """Seconds to wait before calling endpoint, spreading its remaining requests over the reset window"""
+        try:
+            limits = self.rate_limits[endpoint]
+            remaining = int(limits['remaining'])
+            reset = int(limits['reset'])
+        except (KeyError, TypeError, ValueError):
+            return 0
+        
+        # An exhausted window is handled by the client's wait_on_rate_limit
+        if remaining <= 0:
+            return 0
+        window = max(reset - time.time(), 0)
+        return min(window / remaining, MAX_PACING_DELAY)
     
     def can_make_call(self):
         """Check if we can make another API call"""
@@ -196,11 +298,7 @@ class TrustEnabledAPITracker:
     def _calculate_efficiency(self):
         """Calculate API usage efficiency"""
         total = self.usage_data.get('total_calls', 0)
-        if total <= 20: return "Excellent"
-        elif total <= 35: return "Very Good"
-        elif total <= 50: return "Good"
-        elif total <= 55: return "Fair"
-        else: return "Poor"
+        return next(rating for threshold, rating in EFFICIENCY_RATINGS if total <= threshold)
 
 class TrustEnabledMentionMonitor:
     """Advanced mention monitor with integrated trust validation"""
@@ -210,8 +308,38 @@ class TrustEnabledMentionMonitor:
         self.client = None
         self.base_analyzer = ComprehensiveAnalyzer()
         self.trust_analyzer = None
-        self.last_seen_id = self.read_last_seen_id()
+        self.last_seen_id = self._load_last_seen_id()
+        if self.last_seen_id:
+            logger.info(f"📖 Last seen tweet ID: {self.last_seen_id}")
+        else:
+            logger.info("📖 No previous tweet ID found")
         
+    def _load_last_seen_id(self):
+        """Newest of the usage-file cursor and the shared last_seen_id.txt (other monitors advance it)"""
+        candidates = [self.api_tracker.usage_data.get('last_seen_id')]
+        try:
+            if os.path.exists(LAST_SEEN_ID_FILE):
+                with open(LAST_SEEN_ID_FILE, 'r') as f:
+                    candidates.append(f.read().strip())
+        except Exception as e:
+            logger.error(f"❌ Error reading {LAST_SEEN_ID_FILE}: {e}")
+        
+        ids = [int(c) for c in candidates if c and str(c).isdigit()]
+        if not ids:
+            return None
+        
+        last_id = max(ids)
+        self.api_tracker.usage_data['last_seen_id'] = last_id
+        return last_id
+    
+    def _write_last_seen_id(self, tweet_id):
+        """Keep the shared last_seen_id.txt in step so main.py and main_enhanced.py skip these mentions too"""
+        try:
+            with open(LAST_SEEN_ID_FILE, 'w') as f:
+                f.write(str(tweet_id))
+        except Exception as e:
+            logger.error(f"❌ Error writing {LAST_SEEN_ID_FILE}: {e}")
+    
     def initialize_system(self):
         """Initialize the complete trust-enabled system"""
         try:
@@ -264,6 +392,7 @@ class TrustEnabledMentionMonitor:
                 access_token_secret=ACCESS_TOKEN_SECRET,
                 wait_on_rate_limit=True
             )
+            self.client.session.hooks['response'].append(self.api_tracker.capture_rate_limit_headers)
             
             if self.api_tracker.can_make_call():
                 me = self.client.get_me()
@@ -278,30 +407,6 @@ class TrustEnabledMentionMonitor:
             logger.error(f"❌ Authentication failed: {e}")
             return False
     
-    def read_last_seen_id(self):
-        """Read the last processed tweet ID"""
-        try:
-            if os.path.exists(LAST_SEEN_ID_FILE):
-                with open(LAST_SEEN_ID_FILE, 'r') as f:
-                    last_id = f.read().strip()
-                    if last_id:
-                        logger.info(f"📖 Last seen tweet ID: {last_id}")
-                        return int(last_id)
-            logger.info("📖 No previous tweet ID found")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Error reading last seen ID: {e}")
-            return None
-    
-    def write_last_seen_id(self, tweet_id):
-        """Save the latest processed tweet ID"""
-        try:
-            with open(LAST_SEEN_ID_FILE, 'w') as f:
-                f.write(str(tweet_id))
-            logger.info(f"💾 Saved last seen tweet ID: {tweet_id}")
-        except Exception as e:
-            logger.error(f"❌ Error saving last seen ID: {e}")
-    
     def fetch_mentions(self):
         """Fetch new mentions with comprehensive data"""
         if TEST_MODE:
@@ -337,6 +442,15 @@ class TrustEnabledMentionMonitor:
                 params['since_id'] = self.last_seen_id
             
             mentions = self.client.get_users_mentions(**params)
+            
+            # Update last seen ID before recording the call so a single usage flush persists both
+            newest_id = mentions.meta.get('newest_id') if mentions.meta else None
+            if newest_id:
+                self.last_seen_id = newest_id
+                self.api_tracker.usage_data['last_seen_id'] = newest_id
+                self._write_last_seen_id(newest_id)
+                logger.info(f"💾 Last seen tweet ID: {newest_id}")
+            
             self.api_tracker.record_api_call("get_users_mentions", 1, "general")
             
             if not mentions.data:
@@ -345,10 +459,6 @@ class TrustEnabledMentionMonitor:
             
             logger.info(f"📬 Found {len(mentions.data)} new mentions")
             
-            # Update last seen ID
-            if mentions.meta.get('newest_id'):
-                self.write_last_seen_id(mentions.meta['newest_id'])
-            
             # Filter relevant mentions
             relevant_mentions = []
             for mention in mentions.data:
@@ -370,57 +480,9 @@ class TrustEnabledMentionMonitor:
         """Generate comprehensive test mentions"""
         logger.info("🧪 TEST MODE: Generating enhanced test data")
         
-        class MockMention:
-            def __init__(self):
-                self.id = "1234567890123456789"
-                self.text = "Impressive blockchain security research! @satyvm acc what's your analysis of this new DeFi protocol's smart contract architecture?"
-                self.author_id = "987654321098765432"
-                self.in_reply_to_user_id = "555666777888999000"
-                self.created_at = datetime.now(timezone.utc)
-        
-        class MockUser:
-            def __init__(self, user_type="target"):
-                if user_type == "target":
-                    self.id = "555666777888999000"
-                    self.username = "defi_security_expert"
-                    self.name = "Alex Chen | DeFi Security Researcher"
-                    self.description = "🔐 Lead Security Researcher @trailofbits | Smart Contract Auditor | DeFi Protocol Advisor | Previously @consensys | Building safer Web3 | alex.eth"
-                    self.location = "San Francisco, CA"
-                    self.url = "https://alexchen.security"
-                    self.profile_image_url = "https://example.com/alex_avatar.jpg"
-                    self.created_at = datetime(2018, 11, 20, tzinfo=timezone.utc)
-                    self.verified = True
-                    self.verified_type = "blue"
-                    self.protected = False
-                    self.public_metrics = {
-                        'followers_count': 15420,
-                        'following_count': 892,
-                        'tweet_count': 3247,
-                        'listed_count': 189
-                    }
-                else:
-                    self.id = "987654321098765432"
-                    self.username = "crypto_enthusiast"
-                    self.name = "Crypto Enthusiast"
-                    self.description = "Web3 builder and DeFi researcher"
-                    self.location = "Remote"
-                    self.created_at = datetime(2021, 5, 1, tzinfo=timezone.utc)
-                    self.verified = False
-                    self.protected = False
-                    self.public_metrics = {
-                        'followers_count': 823,
-                        'following_count': 1240,
-                        'tweet_count': 1456,
-                        'listed_count': 12
-                    }
-        
-        mock_mention = MockMention()
-        mock_replier = MockUser("replier")
-        mock_target = MockUser("target")
-        mock_includes = {'users': [mock_replier, mock_target]}
-        
+        mentions = _build_test_mentions()
         logger.info("🧪 Generated comprehensive test data with trust validation targets")
-        return [(mock_mention, mock_includes)]
+        return mentions
     
     def analyze_mention(self, mention, includes):
         """Perform comprehensive analysis with trust validation"""
@@ -480,8 +542,10 @@ class TrustEnabledMentionMonitor:
             
             if hasattr(user, 'public_metrics'):
                 metrics = user.public_metrics
-                output.append(f"👥 Network: {metrics.get('followers_count', 0):,} followers / {metrics.get('following_count', 0):,} following")
-                ratio = metrics.get('followers_count', 0) / max(metrics.get('following_count', 1), 1)
+                followers = metrics.get('followers_count', 0)
+                following = metrics.get('following_count', 0)
+                ratio = followers / (following or 1)
+                output.append(f"👥 Network: {followers:,} followers / {following:,} following")
                 output.append(f"📊 Ratio: {ratio:.2f} | Tweets: {metrics.get('tweet_count', 0):,}")
             
             if getattr(user, 'verified', False):
@@ -496,10 +560,10 @@ class TrustEnabledMentionMonitor:
             output.append("="*90)
             
             # Print and save
-            for line in output:
-                print(line)
+            text = "\n".join(output)
+            print(text)
             
-            self._save_to_file(output, 'enhanced_mentions_output.txt')
+            self._save_to_file(text, 'enhanced_mentions_output.txt')
             
         except Exception as e:
             logger.error(f"❌ Error displaying basic info: {e}")
@@ -571,14 +635,11 @@ class TrustEnabledMentionMonitor:
             logger.error(f"❌ Error fetching tweets: {e}")
             return None
     
-    def _save_to_file(self, content, filename):
-        """Save content to file"""
+    def _save_to_file(self, text, filename):
+        """Append pre-joined text to file in a single write"""
         try:
             with open(filename, 'a', encoding='utf-8') as f:
-                f.write(f"\n--- {datetime.now(timezone.utc).isoformat()} ---\n")
-                for line in content:
-                    f.write(line + "\n")
-                f.write("\n")
+                f.write(f"\n--- {datetime.now(timezone.utc).isoformat()} ---\n{text}\n\n")
         except Exception as e:
             logger.error(f"❌ Error saving to file: {e}")
     
@@ -608,9 +669,11 @@ class TrustEnabledMentionMonitor:
                 logger.info(f"📱 Processing mention {i}/{len(mentions)}")
                 self.analyze_mention(mention, includes)
                 
-                # Small delay between mentions
+                # Pace mentions by the observed rate limit headroom
                 if i < len(mentions):
-                    time.sleep(0.5)
+                    delay = self.api_tracker.get_pacing_delay(MENTION_ANALYSIS_ENDPOINT)
+                    if delay > 0:
+                        time.sleep(delay)
             
             logger.info("✅ Monitoring session completed")
             
@@ -626,6 +689,7 @@ class TrustEnabledMentionMonitor:
     def _display_session_summary(self):
         """Display comprehensive session summary"""
         try:
+            self.api_tracker.finalize_session()
             summary = self.api_tracker.get_detailed_summary()
             
             print("\n" + "="*80)
@@ -15,39 +15,53 @@ Usage:
 
 import os
 import sys
+import re
 import argparse
+import importlib.util
 import subprocess
 from pathlib import Path
 
+# Variables that must be present and non-empty in .env
+REQUIRED_ENV_VARS = [
+    'BEARER_TOKEN',
+    'API_KEY', 
+    'API_KEY_SECRET',
+    'ACCESS_TOKEN',
+    'ACCESS_TOKEN_SECRET',
+    'YOUR_SATYVM_USER_ID'
+]
+
+# Single-pass scanner for NAME=value / NAME="value" / NAME='value' lines of the required variables
+# (indented and `export NAME=...` lines, trailing # comments and CRLF endings are accepted, as python-dotenv does)
+_ENV_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?(' + '|'.join(map(re.escape, REQUIRED_ENV_VARS)) + r')[ \t]*=[ \t]*'
+    r'(?:"([^"\r\n]*)"[ \t]*(?:#.*?)?|\'([^\'\r\n]*)\'[ \t]*(?:#.*?)?|([^\r\n]*?)(?:[ \t]+#.*?)?)[ \t]*\r?$',
+    re.M
+)
+
+# Parsed .env contents keyed by (mtime_ns, size)
+_ENV_CACHE = {}
+
 def setup_environment(test_mode=False, debug_mode=False):
-    """Setup environment variables for the run"""
-    env = os.environ.copy()
+    """Set run-mode flags directly on os.environ (inherited by the monitor process)"""
+    os.environ['TEST_MODE'] = 'true' if test_mode else 'false'
+    os.environ['DEBUG_MODE'] = 'true' if debug_mode else 'false'
     
     if test_mode:
-        env['TEST_MODE'] = 'true'
         print("🧪 Running in TEST MODE - No real API calls will be made")
-    else:
-        env['TEST_MODE'] = 'false'
     
     if debug_mode:
-        env['DEBUG_MODE'] = 'true'
         print("🔍 Running in DEBUG MODE - Verbose logging enabled")
-    else:
-        env['DEBUG_MODE'] = 'false'
-    
-    return env
 
 def check_dependencies():
-    """Check if required dependencies are installed"""
-    try:
-        import tweepy
-        import dotenv
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    """Check if required dependencies are installed (locates them without importing)"""
+    missing = [name for name in ('tweepy', 'dotenv') if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("📦 Install dependencies with: uv sync")
         print("📦 Or with pip: pip install tweepy python-dotenv")
         return False
+    return True
 
 def check_env_file():
     """Check if .env file exists and has required variables"""
@@ -58,22 +72,8 @@ def check_env_file():
         return False
     
     # Read and check for required variables
-    required_vars = [
-        'BEARER_TOKEN',
-        'API_KEY', 
-        'API_KEY_SECRET',
-        'ACCESS_TOKEN',
-        'ACCESS_TOKEN_SECRET',
-        'YOUR_SATYVM_USER_ID'
-    ]
-    
-    with open('.env', 'r') as f:
-        content = f.read()
-    
-    missing_vars = []
-    for var in required_vars:
-        if var not in content or f'{var}=""' in content:
-            missing_vars.append(var)
+    env_values = _parse_env_file(env_file)
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not env_values.get(var)]
     
     if missing_vars:
         print(f"❌ Missing or empty variables in .env: {', '.join(missing_vars)}")
@@ -81,6 +81,24 @@ def check_env_file():
     
     return True
 
+def _parse_env_file(env_file):
+    """Parse .env into a dict, reusing the cached result while the file is unchanged"""
+    st = env_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if key in _ENV_CACHE:
+        return _ENV_CACHE[key]
+    
+    with open(env_file, 'r') as f:
+        content = f.read()
+    values = {
+        m.group(1): next(value for value in m.group(2, 3, 4) if value is not None)
+        for m in _ENV_RE.finditer(content)
+    }
+    
+    _ENV_CACHE.clear()
+    _ENV_CACHE[key] = values
+    return values
+
 def show_usage_info():
     """Show API usage information"""
     usage_file = Path('api_usage.json')
@@ -95,6 +113,16 @@ def show_usage_info():
         except Exception:
             pass
 
+def exec_monitor():
+    """Replace the current process with main.py (via uv when available)"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp('uv', ['uv', 'run', 'python', 'main.py'])
+    except FileNotFoundError:
+        # uv not found, use regular python
+        os.execv(sys.executable, [sys.executable, 'main.py'])
+
 def main():
     parser = argparse.ArgumentParser(
         description='X Account Mention Analyzer - Monitor mentions efficiently',
@@ -139,20 +167,23 @@ Examples:
     print("✅ All checks passed!\n")
     
     # Setup environment
-    env = setup_environment(args.test, args.debug)
+    setup_environment(args.test, args.debug)
     
     # Run the main script
     try:
         print("🚀 Starting X mention monitor...\n")
         
+        # On POSIX replace this process with the monitor - no fork, no wait
+        if os.name == 'posix':
+            exec_monitor()
+        
+        # exec* does not replace the process image on Windows, so spawn and wait there
         # Use uv if available, otherwise fall back to python
         try:
-            result = subprocess.run(['uv', 'run', 'python', 'main.py'], 
-                                  env=env, check=True)
+            result = subprocess.run(['uv', 'run', 'python', 'main.py'], check=True)
         except FileNotFoundError:
             # uv not found, use regular python
-            result = subprocess.run([sys.executable, 'main.py'], 
-                                  env=env, check=True)
+            result = subprocess.run([sys.executable, 'main.py'], check=True)
         
         print("\n✅ Monitor completed successfully!")
         return 0
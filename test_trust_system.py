@@ -14,29 +14,19 @@ Author: X Analysis Bot
 Version: 1.0
 """
 
-import tweepy
 import os
 import sys
-import json
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Dict, Optional
 
 # Add trust_system to path
 sys.path.append(str(Path(__file__).parent / "trust_system"))
 
-try:
-    from trust_system.trusted_accounts import TrustedAccountValidator
-    from trust_system.trust_integration import TrustIntegratedAnalyzer
-    from enhanced_analysis import ComprehensiveAnalyzer
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    print("Make sure all required modules are in the trust_system directory")
-    sys.exit(1)
-
-# Load environment variables
-load_dotenv()
+# tweepy, dotenv and the trust_system modules are imported at point of use so the
+# missing-files check in main() fails fast without paying their import cost
 
 # Setup logging
 logging.basicConfig(
@@ -57,6 +47,29 @@ TEST_USERNAMES = [
     "JupiterExchange"
 ]
 
+# Section separators
+_BANNER = "=" * 60
+_TITLE_BANNER = "=" * 80
+
+@dataclass(frozen=True, slots=True)
+class MockUser:
+    """Static @satyvm profile used by the integration test"""
+    id: str = "912363642154127361"
+    username: str = "satyvm"
+    name: str = "satyam"
+    description: str = "dev, writer & building @fitfocus_app | satyam.btc @Stacks | satyvm.eth"
+    location: str = "Remote"
+    url: Optional[str] = None
+    created_at: datetime = datetime(2017, 9, 1, tzinfo=timezone.utc)
+    verified: bool = False
+    protected: bool = False
+    public_metrics: Dict[str, int] = field(default_factory=lambda: {
+        'followers_count': 58,
+        'following_count': 87,
+        'tweet_count': 253,
+        'listed_count': 0
+    })
+
 class TrustSystemTester:
     """Comprehensive tester for the trust validation system"""
     
@@ -76,6 +89,8 @@ class TrustSystemTester:
         try:
             print("🔐 Setting up Twitter API client...")
             
+            import tweepy
+            
             bearer_token = os.getenv("BEARER_TOKEN")
             api_key = os.getenv("API_KEY")
             api_key_secret = os.getenv("API_KEY_SECRET")
@@ -107,9 +122,11 @@ class TrustSystemTester:
     def test_github_fetch(self):
         """Test fetching trusted accounts from GitHub"""
         try:
-            print("\n" + "="*60)
+            print("\n" + _BANNER)
             print("🔍 TEST 1: GitHub Trust List Fetch")
-            print("="*60)
+            print(_BANNER)
+            
+            from trust_system.trusted_accounts import TrustedAccountValidator
             
             self.trust_validator = TrustedAccountValidator(self.client)
             
@@ -139,9 +156,9 @@ class TrustSystemTester:
     def test_username_resolution(self):
         """Test resolving usernames to user IDs"""
         try:
-            print("\n" + "="*60)
+            print("\n" + _BANNER)
             print("🔄 TEST 2: Username to ID Resolution")
-            print("="*60)
+            print(_BANNER)
             
             if not self.trust_validator:
                 print("❌ Trust validator not initialized")
@@ -181,9 +198,9 @@ class TrustSystemTester:
     def test_trust_validation(self):
         """Test trust validation for known accounts"""
         try:
-            print("\n" + "="*60)
+            print("\n" + _BANNER)
             print("🔒 TEST 3: Trust Validation")
-            print("="*60)
+            print(_BANNER)
             
             if not self.trust_validator or not self.trust_validator.trusted_user_ids:
                 print("❌ Trust validator not properly initialized")
@@ -240,30 +257,14 @@ class TrustSystemTester:
     def test_integration(self):
         """Test integration with comprehensive analysis"""
         try:
-            print("\n" + "="*60)
+            print("\n" + _BANNER)
             print("🔬 TEST 4: Integration Test")
-            print("="*60)
-            
-            # Create mock user for testing
-            class MockUser:
-                def __init__(self):
-                    self.id = "912363642154127361"
-                    self.username = "satyvm"
-                    self.name = "satyam"
-                    self.description = "dev, writer & building @fitfocus_app | satyam.btc @Stacks | satyvm.eth"
-                    self.location = "Remote"
-                    self.url = None
-                    self.created_at = datetime(2017, 9, 1, tzinfo=timezone.utc)
-                    self.verified = False
-                    self.protected = False
-                    self.public_metrics = {
-                        'followers_count': 58,
-                        'following_count': 87,
-                        'tweet_count': 253,
-                        'listed_count': 0
-                    }
+            print(_BANNER)
             
             # Initialize integrated analyzer
+            from trust_system.trust_integration import TrustIntegratedAnalyzer
+            from enhanced_analysis import ComprehensiveAnalyzer
+            
             base_analyzer = ComprehensiveAnalyzer()
             trust_analyzer = TrustIntegratedAnalyzer(self.client, base_analyzer)
             trust_analyzer.trust_validator = self.trust_validator
@@ -314,9 +315,9 @@ class TrustSystemTester:
     def test_format_display(self):
         """Test formatting and display functions"""
         try:
-            print("\n" + "="*60)
+            print("\n" + _BANNER)
             print("📋 TEST 5: Format and Display")
-            print("="*60)
+            print(_BANNER)
             
             # Create sample validation result
             sample_result = {
@@ -363,38 +364,49 @@ class TrustSystemTester:
     def run_all_tests(self):
         """Run all trust system tests"""
         print("🚀 Starting Trust System Comprehensive Test Suite")
-        print("=" * 80)
+        print(_TITLE_BANNER)
         
         # Setup
         if not self.setup_api_client():
             print("❌ Test suite failed - could not setup API client")
             return False
         
-        # Run tests
+        # Run tests - (name, key, function, prerequisite keys)
         tests = [
-            ("GitHub Fetch & Parsing", self.test_github_fetch),
-            ("Username Resolution", self.test_username_resolution),
-            ("Trust Validation", self.test_trust_validation),
-            ("Integration", self.test_integration),
-            ("Format & Display", self.test_format_display),
+            ("GitHub Fetch & Parsing", "github_fetch", self.test_github_fetch, []),
+            ("Username Resolution", "username_resolution", self.test_username_resolution, ["github_fetch"]),
+            ("Trust Validation", "trust_validation", self.test_trust_validation, ["username_resolution"]),
+            ("Integration", "integration_test", self.test_integration, ["trust_validation"]),
+            ("Format & Display", "format_display", self.test_format_display, ["github_fetch"]),
         ]
         
         passed_tests = 0
         total_tests = len(tests)
+        outcomes = {}
         
-        for test_name, test_func in tests:
+        for test_name, key, test_func, prerequisites in tests:
+            failed_prerequisites = [dep for dep in prerequisites if not outcomes.get(dep)]
+            if failed_prerequisites:
+                print(f"⏭️ {test_name} test skipped - prerequisite failed: {', '.join(failed_prerequisites)}")
+                outcomes[key] = False
+                continue
+            
             try:
-                if test_func():
-                    passed_tests += 1
-                else:
-                    print(f"❌ {test_name} test failed")
+                outcomes[key] = bool(test_func())
             except Exception as e:
                 print(f"❌ {test_name} test crashed: {e}")
+                outcomes[key] = False
+                continue
+            
+            if outcomes[key]:
+                passed_tests += 1
+            else:
+                print(f"❌ {test_name} test failed")
         
         # Final summary
-        print("\n" + "="*80)
+        print("\n" + _TITLE_BANNER)
         print("📊 TEST SUITE SUMMARY")
-        print("="*80)
+        print(_TITLE_BANNER)
         print(f"✅ Passed: {passed_tests}/{total_tests} tests")
         print(f"❌ Failed: {total_tests - passed_tests}/{total_tests} tests")
         
@@ -421,6 +433,14 @@ class TrustSystemTester:
             print(f"\n⚠️ Trust system has issues. ({success_rate:.1f}% success rate)")
             return False
 
+def _list_dir(path):
+    """Return the entry names in a directory, or an empty set if it doesn't exist"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 def main():
     """Run the trust system test suite"""
     print("🔒 Trust System Test Suite")
@@ -437,9 +457,14 @@ def main():
         "trust_system/trust_integration.py"
     ]
     
+    # One directory listing per parent instead of a stat per file
+    listings = {}
     missing_files = []
     for file_path in required_files:
-        if not Path(file_path).exists():
+        parent, name = os.path.split(file_path)
+        if parent not in listings:
+            listings[parent] = _list_dir(parent or '.')
+        if name not in listings[parent]:
             missing_files.append(file_path)
     
     if missing_files:
@@ -449,6 +474,16 @@ def main():
         print("\nPlease ensure all required files are present before running tests.")
         return
     
+    try:
+        from dotenv import load_dotenv
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        print("📦 Install dependencies with: uv sync")
+        sys.exit(1)
+    
+    # Load environment variables
+    load_dotenv()
+    
     # Run tests
     tester = TrustSystemTester()
     success = tester.run_all_tests()
@@ -22,6 +22,8 @@ __version__ = "1.0.0"
 __author__ = "X Analysis Bot"
 __description__ = "Trusted account validation system for X/Twitter analysis"
 
+import copy
+
 # Import main classes for easy access
 from .trusted_accounts import TrustedAccountValidator
 from .trust_integration import TrustIntegratedAnalyzer, TrustAwareReporting
@@ -32,31 +34,28 @@ DEFAULT_MIN_TRUSTED_FOLLOWERS = 2
 DEFAULT_CACHE_DURATION_HOURS = 24
 DEFAULT_MAX_API_CALLS = 50
 
-# Convenience functions
-def create_trust_validator(api_client):
-    """
-    Create a configured TrustedAccountValidator instance
-    
-    Args:
-        api_client: Authenticated tweepy.Client instance
-        
-    Returns:
-        TrustedAccountValidator: Configured validator instance
-    """
-    return TrustedAccountValidator(api_client)
+# Convenience aliases - direct class references, no wrapper frame per call
+create_trust_validator = TrustedAccountValidator
+create_trust_integrated_analyzer = TrustIntegratedAnalyzer
 
-def create_trust_integrated_analyzer(api_client, base_analyzer):
-    """
-    Create a configured TrustIntegratedAnalyzer instance
-    
-    Args:
-        api_client: Authenticated tweepy.Client instance
-        base_analyzer: ComprehensiveAnalyzer instance
-        
-    Returns:
-        TrustIntegratedAnalyzer: Configured integrated analyzer
-    """
-    return TrustIntegratedAnalyzer(api_client, base_analyzer)
+# Package information, built once; get_package_info hands out copies
+_PACKAGE_INFO = {
+    'name': 'trust_system',
+    'version': __version__,
+    'author': __author__,
+    'description': __description__,
+    'trust_list_url': TRUST_LIST_URL,
+    'components': [
+        'TrustedAccountValidator',
+        'TrustIntegratedAnalyzer', 
+        'TrustAwareReporting'
+    ],
+    'default_settings': {
+        'min_trusted_followers': DEFAULT_MIN_TRUSTED_FOLLOWERS,
+        'cache_duration_hours': DEFAULT_CACHE_DURATION_HOURS,
+        'max_api_calls': DEFAULT_MAX_API_CALLS
+    }
+}
 
 def get_package_info():
     """
@@ -64,24 +63,9 @@ def get_package_info():
     
     Returns:
         dict: Package information including version, components, etc.
+              (a fresh copy - callers may modify it freely)
     """
-    return {
-        'name': 'trust_system',
-        'version': __version__,
-        'author': __author__,
-        'description': __description__,
-        'trust_list_url': TRUST_LIST_URL,
-        'components': [
-            'TrustedAccountValidator',
-            'TrustIntegratedAnalyzer', 
-            'TrustAwareReporting'
-        ],
-        'default_settings': {
-            'min_trusted_followers': DEFAULT_MIN_TRUSTED_FOLLOWERS,
-            'cache_duration_hours': DEFAULT_CACHE_DURATION_HOURS,
-            'max_api_calls': DEFAULT_MAX_API_CALLS
-        }
-    }
+    return copy.deepcopy(_PACKAGE_INFO)
 
 # Export all public components
 __all__ = [
@@ -9,14 +9,49 @@ Author: X Analysis Bot
 Version: 1.0
 """
 
+import bisect
+import functools
+import heapq
 import logging
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Tuple
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from .trusted_accounts import TrustedAccountValidator
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Followers returned per get_users_followers page
+FOLLOWERS_PER_PAGE = 1000
+
+# API call budget for a single quick trust check
+QUICK_CHECK_MAX_CALLS = 5
+
+# Trust levels strong enough to mark existing risk factors as mitigated
+MITIGATING_TRUST_LEVELS = frozenset({'Highly Trusted', 'Well Trusted'})
+MITIGATED_RISK_PREFIX = "(Mitigated by trust validation) "
+
+# Combined trust metric lower bounds -> integration tier (labels has one more entry)
+INTEGRATION_TIER_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+INTEGRATION_TIER_LABELS = ("Limited Trust", "Basic Trust", "Moderate Trust", "High Trust", "Premium Trust")
+
+# Trust level -> profile badge (read-only)
+TRUST_BADGES = MappingProxyType({
+    'Highly Trusted': '🏆 Highly Trusted',
+    'Well Trusted': '⭐ Well Trusted',
+    'Moderately Trusted': '✅ Trusted',
+    'Lightly Trusted': '🔹 Verified',
+    'Minimally Trusted': '◾ Basic Trust'
+})
+
 class TrustIntegratedAnalyzer:
     """Enhanced analyzer with integrated trusted account validation"""
     
@@ -37,6 +72,10 @@ class TrustIntegratedAnalyzer:
         self.min_trusted_followers = 2
         self.trust_boost_factor = 0.3  # How much trust validation boosts scores
         self.max_trust_api_calls = 20  # API calls budget for trust validation
+        self.max_follower_pages = 1  # Follower pages per validation (raise to scan large accounts deeper)
+        
+        # Runs trust validation alongside the base analysis
+        self._executor = ThreadPoolExecutor(max_workers=2)
         
     def initialize_trust_system(self) -> bool:
         """Initialize the trusted account validation system"""
@@ -73,16 +112,22 @@ class TrustIntegratedAnalyzer:
         Returns:
             Enhanced analysis results with trust validation
         """
+        logger.info("🔬 Starting trust-integrated analysis for @%s", getattr(user, 'username', 'unknown'))
+        
+        # Start trust validation first so its network calls overlap the base analysis
+        trust_future = None
+        if self.trust_enabled or force_trust_check:
+            trust_future = self._executor.submit(self._perform_trust_validation, user)
+        
+        # Perform base comprehensive analysis once - a trust failure must not redo it
+        analysis_results = self.base_analyzer.analyze_comprehensive_profile(user, tweets_data)
+        
         try:
-            logger.info(f"🔬 Starting trust-integrated analysis for @{getattr(user, 'username', 'unknown')}")
-            
-            # Perform base comprehensive analysis
-            analysis_results = self.base_analyzer.analyze_comprehensive_profile(user, tweets_data)
-            
             # Add trust validation if enabled
             trust_results = None
-            if self.trust_enabled or force_trust_check:
-                trust_results = self._perform_trust_validation(user)
+            if trust_future:
+                # No timeout - with wait_on_rate_limit a full scan can legitimately take minutes
+                trust_results = trust_future.result()
                 if trust_results:
                     analysis_results['trust_validation'] = trust_results
                     
@@ -95,12 +140,12 @@ class TrustIntegratedAnalyzer:
                     'reason': 'Trust system not initialized'
                 }
             
-            # Add trust integration metadata
+            # Add trust integration metadata (reuses the base analysis timestamp)
             analysis_results['trust_integration'] = {
                 'enabled': self.trust_enabled,
                 'validation_performed': trust_results is not None,
                 'api_calls_used': self.trust_validator.api_calls_made if self.trust_validator else 0,
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': analysis_results.get('timestamp') or datetime.now(timezone.utc).isoformat()
             }
             
             return analysis_results
@@ -108,10 +153,78 @@ class TrustIntegratedAnalyzer:
         except Exception as e:
             logger.error(f"❌ Error in trust-integrated analysis: {e}")
             # Return base analysis without trust validation
-            return self.base_analyzer.analyze_comprehensive_profile(user, tweets_data)
+            analysis_results['trust_validation'] = {
+                'enabled': False,
+                'reason': 'integration_error'
+            }
+            return analysis_results
     
-    def _perform_trust_validation(self, user) -> Optional[Dict[str, Any]]:
-        """Perform trusted account validation for a user"""
+    def analyze_batch_with_trust_validation(self, users: Iterable, tweets_map: Optional[Dict[str, Any]] = None,
+                                            max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several users, overlapping their trust validation network calls
+        
+        Args:
+            users: Twitter user objects
+            tweets_map: Optional user_id -> tweets data mapping
+            max_workers: Concurrent trust validations
+            
+        Returns:
+            user_id -> enhanced analysis results
+        """
+        users = list(users)
+        tweets_map = tweets_map or {}
+        results = {}
+        batch_timestamp = datetime.now(timezone.utc).isoformat()  # One timestamp for the whole batch
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            trust_futures = {}
+            if self.trust_enabled:
+                trust_futures = {
+                    str(getattr(user, 'id', '')): executor.submit(self._perform_trust_validation, user, False)
+                    for user in users
+                }
+            
+            # Base analysis is CPU-only, so run it here while validations wait on the network
+            for user in users:
+                user_id = str(getattr(user, 'id', ''))
+                try:
+                    results[user_id] = self.base_analyzer.analyze_comprehensive_profile(user, tweets_map.get(user_id))
+                except Exception as e:
+                    logger.error(f"❌ Error in base analysis for user ID {user_id}: {e}")
+            
+            trust_by_user = {user_id: future.result() for user_id, future in trust_futures.items()}
+            
+            # Score every validation in one columnar pass
+            validated = [r for r in trust_by_user.values() if r]
+            for validation_result, integration_score in zip(validated, self._calculate_trust_integration_scores_batch(validated)):
+                validation_result['trust_integration_score'] = integration_score
+            
+            for user_id, analysis_results in results.items():
+                trust_results = None
+                if user_id in trust_by_user:
+                    trust_results = trust_by_user[user_id]
+                    if trust_results:
+                        analysis_results['trust_validation'] = trust_results
+                        results[user_id] = self._integrate_trust_scores(analysis_results, trust_results)
+                else:
+                    analysis_results['trust_validation'] = {
+                        'enabled': False,
+                        'reason': 'Trust system not initialized'
+                    }
+                
+                results[user_id]['trust_integration'] = {
+                    'enabled': self.trust_enabled,
+                    'validation_performed': trust_results is not None,
+                    'api_calls_used': self.trust_validator.api_calls_made if self.trust_validator else 0,
+                    'timestamp': batch_timestamp
+                }
+        
+        logger.info("✅ Batch trust-integrated analysis complete for %d users", len(results))
+        return results
+    
+    def _perform_trust_validation(self, user, score_integration: bool = True) -> Optional[Dict[str, Any]]:
+        """Perform trusted account validation for a user (batch callers score integration themselves)"""
         try:
             if not self.trust_validator:
                 logger.warning("⚠️ Trust validator not available")
@@ -122,21 +235,25 @@ class TrustIntegratedAnalyzer:
                 logger.warning("⚠️ No user ID available for trust validation")
                 return None
             
-            logger.info(f"🔍 Performing trust validation for user ID: {user_id}")
+            logger.info("🔍 Performing trust validation for user ID: %s", user_id)
             
-            # Perform the validation
+            # Perform the validation (served from the validator's cache when a deep enough result exists)
             validation_result = self.trust_validator.check_trusted_followers(
                 user_id, 
-                self.min_trusted_followers
+                self.min_trusted_followers,
+                max_pages=self._follower_page_budget(user),
+                follower_count=self._followers_count(user)
             )
             
             if validation_result:
                 # Add additional trust metrics
-                validation_result['trust_integration_score'] = self._calculate_trust_integration_score(validation_result)
+                if score_integration:
+                    validation_result['trust_integration_score'] = self._calculate_trust_integration_score(validation_result)
                 
-                status = "✅ Validated" if validation_result.get('is_validated') else "❌ Not Validated"
-                follower_count = validation_result.get('trusted_follower_count', 0)
-                logger.info(f"🎯 Trust validation complete: {follower_count} trusted followers → {status}")
+                if logger.isEnabledFor(logging.INFO):
+                    status = "✅ Validated" if validation_result.get('is_validated') else "❌ Not Validated"
+                    follower_count = validation_result.get('trusted_follower_count', 0)
+                    logger.info("🎯 Trust validation complete: %d trusted followers → %s", follower_count, status)
             
             return validation_result
             
@@ -144,6 +261,18 @@ class TrustIntegratedAnalyzer:
             logger.error(f"❌ Error performing trust validation: {e}")
             return None
     
+    def _followers_count(self, user) -> Optional[int]:
+        """Follower count from the user's public metrics, if present"""
+        return (getattr(user, 'public_metrics', None) or {}).get('followers_count')
+    
+    def _follower_page_budget(self, user) -> int:
+        """Follower pages worth fetching for this user, capped by max_follower_pages and the trust API budget"""
+        followers_count = self._followers_count(user)
+        if not followers_count:
+            return 1
+        page_cap = min(self.max_follower_pages, self.max_trust_api_calls)
+        return max(1, min(page_cap, math.ceil(followers_count / FOLLOWERS_PER_PAGE)))
+    
     def _integrate_trust_scores(self, analysis_results: Dict[str, Any], trust_results: Dict[str, Any]) -> Dict[str, Any]:
         """Integrate trust validation results into the main analysis scores"""
         try:
@@ -152,16 +281,19 @@ class TrustIntegratedAnalyzer:
                 return analysis_results
             
             trust_score = trust_results.get('trust_score', {})
+            trust_level = trust_score.get('trust_level', 'Unknown')
             validation_strength = trust_results.get('validation_strength', 0)
             
             # Calculate trust boost factor
             trust_boost = (validation_strength / 100) * self.trust_boost_factor
+            apply_boost = trust_boost > 0.0  # A zero boost leaves every score as it is
             
             # Enhance credibility score
             if 'overall_scores' in analysis_results:
-                current_credibility = analysis_results['overall_scores'].get('credibility_score', 0)
-                trust_enhanced_credibility = min(current_credibility + (trust_boost * 100), 100)
-                analysis_results['overall_scores']['credibility_score'] = round(trust_enhanced_credibility, 1)
+                if apply_boost:
+                    current_credibility = analysis_results['overall_scores'].get('credibility_score', 0)
+                    trust_enhanced_credibility = min(current_credibility + (trust_boost * 100), 100)
+                    analysis_results['overall_scores']['credibility_score'] = round(trust_enhanced_credibility, 1)
                 
                 # Add trust-specific scoring
                 analysis_results['overall_scores']['trust_boost_applied'] = round(trust_boost * 100, 1)
@@ -169,29 +301,30 @@ class TrustIntegratedAnalyzer:
             
             # Enhance risk assessment
             if 'risk_assessment' in analysis_results:
-                current_authenticity = analysis_results['risk_assessment'].get('authenticity_score', 0)
-                trust_enhanced_authenticity = min(current_authenticity + (trust_boost * 50), 100)
-                analysis_results['risk_assessment']['authenticity_score'] = round(trust_enhanced_authenticity, 1)
+                if apply_boost:
+                    current_authenticity = analysis_results['risk_assessment'].get('authenticity_score', 0)
+                    trust_enhanced_authenticity = min(current_authenticity + (trust_boost * 50), 100)
+                    analysis_results['risk_assessment']['authenticity_score'] = round(trust_enhanced_authenticity, 1)
                 
                 # Reduce risk factors if highly trusted
-                if trust_score.get('trust_level') in ['Highly Trusted', 'Well Trusted']:
-                    risk_factors = analysis_results['risk_assessment'].get('risk_factors', [])
+                if trust_level in MITIGATING_TRUST_LEVELS:
+                    risk_factors = analysis_results['risk_assessment'].get('risk_factors')
                     if risk_factors:
                         analysis_results['risk_assessment']['risk_factors'] = [
-                            f"(Mitigated by trust validation) {factor}" for factor in risk_factors
+                            MITIGATED_RISK_PREFIX + factor for factor in risk_factors
                         ]
             
             # Enhance network influence
             if 'network_influence' in analysis_results:
-                current_influence = analysis_results['network_influence'].get('influence_score', 0)
-                trust_enhanced_influence = min(current_influence + (trust_boost * 30), 100)
-                analysis_results['network_influence']['influence_score'] = round(trust_enhanced_influence, 1)
+                if apply_boost:
+                    current_influence = analysis_results['network_influence'].get('influence_score', 0)
+                    trust_enhanced_influence = min(current_influence + (trust_boost * 30), 100)
+                    analysis_results['network_influence']['influence_score'] = round(trust_enhanced_influence, 1)
                 
                 # Add trust tier information
-                trust_level = trust_score.get('trust_level', 'Unknown')
                 analysis_results['network_influence']['trust_tier'] = trust_level
             
-            logger.info(f"✅ Trust scores integrated - boost factor: {trust_boost:.3f}")
+            logger.info("✅ Trust scores integrated - boost factor: %.3f", trust_boost)
             return analysis_results
             
         except Exception as e:
@@ -200,113 +333,126 @@ class TrustIntegratedAnalyzer:
     
     def _calculate_trust_integration_score(self, validation_result: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate additional trust metrics for integration"""
+        return self._calculate_trust_integration_scores_batch([validation_result])[0]
+    
+    def _calculate_trust_integration_scores_batch(self, validation_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculate integration metrics for several validation results in one columnar pass
+        
+        Metrics are stored unrounded; format them with a precision specifier when displayed.
+        """
         try:
-            trusted_count = validation_result.get('trusted_follower_count', 0)
-            validation_strength = validation_result.get('validation_strength', 0)
-            trust_score = validation_result.get('trust_score', {})
-            
-            # Calculate integration-specific metrics
-            trust_density = trusted_count / max(validation_result.get('validation_details', {}).get('checked_accounts', 1), 1)
-            trust_quality = trust_score.get('overall_score', 0) / 100
+            # Extract input columns once
+            strengths = [r.get('validation_strength', 0) / 100 for r in validation_results]
+            qualities = [r.get('trust_score', {}).get('overall_score', 0) / 100 for r in validation_results]
+            densities = [
+                r.get('trusted_follower_count', 0) / max(r.get('validation_details', {}).get('checked_accounts', 1), 1)
+                for r in validation_results
+            ]
+            # More API calls = more reliable
+            reliabilities = [min(r.get('api_calls_used', 0) / 10, 1.0) for r in validation_results]
             
             # Combined trust metric (0-1 scale)
-            combined_trust_metric = (
-                (validation_strength / 100) * 0.4 +
-                trust_quality * 0.4 +
-                min(trust_density * 10, 1) * 0.2
-            )
-            
-            # Trust reliability indicator
-            api_calls_used = validation_result.get('api_calls_used', 0)
-            reliability_score = min(api_calls_used / 10, 1.0)  # More API calls = more reliable
-            
-            return {
-                'trust_density': round(trust_density, 4),
-                'trust_quality': round(trust_quality, 3),
-                'combined_metric': round(combined_trust_metric, 3),
-                'reliability_score': round(reliability_score, 3),
-                'integration_tier': self._determine_integration_tier(combined_trust_metric)
-            }
+            combined_metrics = [
+                strength * 0.4 + quality * 0.4 + min(density * 10, 1) * 0.2
+                for strength, quality, density in zip(strengths, qualities, densities)
+            ]
+            
+            return [
+                {
+                    'trust_density': density,
+                    'trust_quality': quality,
+                    'combined_metric': combined,
+                    'reliability_score': reliability,
+                    'integration_tier': self._determine_integration_tier(combined)
+                }
+                for density, quality, combined, reliability
+                in zip(densities, qualities, combined_metrics, reliabilities)
+            ]
             
         except Exception as e:
             logger.error(f"❌ Error calculating trust integration score: {e}")
-            return {}
+            return [{} for _ in validation_results]
     
     def _determine_integration_tier(self, combined_metric: float) -> str:
         """Determine trust integration tier based on combined metric"""
-        if combined_metric >= 0.8:
-            return "Premium Trust"
-        elif combined_metric >= 0.6:
-            return "High Trust"
-        elif combined_metric >= 0.4:
-            return "Moderate Trust"
-        elif combined_metric >= 0.2:
-            return "Basic Trust"
-        else:
-            return "Limited Trust"
+        return INTEGRATION_TIER_LABELS[bisect.bisect_right(INTEGRATION_TIER_THRESHOLDS, combined_metric)]
     
     def format_enhanced_analysis_report(self, analysis_results: Dict[str, Any]) -> str:
         """Format comprehensive analysis with integrated trust validation"""
         try:
-            username = analysis_results.get('username', 'Unknown')
-            
-            # Get base formatted analysis
-            base_report = self.base_analyzer.format_comprehensive_analysis(analysis_results)
-            
-            # Add trust validation section
-            trust_section = self._format_trust_section(analysis_results)
-            
-            # Combine reports
-            enhanced_report = base_report
-            
-            # Insert trust section before overall assessment
-            if "🎯 OVERALL ASSESSMENT" in enhanced_report:
-                parts = enhanced_report.split("🎯 OVERALL ASSESSMENT")
-                enhanced_report = parts[0] + trust_section + "\n🎯 OVERALL ASSESSMENT" + parts[1]
-            else:
-                enhanced_report += trust_section
-            
-            return enhanced_report
+            return "".join(self.iter_enhanced_analysis_report(analysis_results))
             
         except Exception as e:
             logger.error(f"❌ Error formatting enhanced analysis report: {e}")
             return self.base_analyzer.format_comprehensive_analysis(analysis_results)
     
+    def iter_enhanced_analysis_report(self, analysis_results: Dict[str, Any]) -> Iterator[str]:
+        """Yield the enhanced report in chunks, trust section inserted before the overall assessment"""
+        # Get base formatted analysis
+        base_report = self.base_analyzer.format_comprehensive_analysis(analysis_results)
+        
+        # Render the small trust section up front so a failure there still leaves the full base report
+        try:
+            trust_section = list(self._iter_trust_section(analysis_results))
+        except Exception as e:
+            logger.error(f"❌ Error formatting trust section: {e}")
+            yield base_report
+            return
+        
+        split_at = base_report.find("🎯 OVERALL ASSESSMENT")
+        if split_at >= 0:
+            yield base_report[:split_at]
+            yield from trust_section
+            yield "\n"
+            yield base_report[split_at:]
+        else:
+            yield base_report
+            yield from trust_section
+    
     def _format_trust_section(self, analysis_results: Dict[str, Any]) -> str:
         """Format the trust validation section of the report"""
+        return "".join(self._iter_trust_section(analysis_results))
+    
+    def _iter_trust_section(self, analysis_results: Dict[str, Any]) -> Iterator[str]:
+        """Yield the trust validation section of the report in chunks"""
         trust_validation = analysis_results.get('trust_validation', {})
         trust_integration = analysis_results.get('trust_integration', {})
         
         if not trust_validation or not trust_integration.get('validation_performed'):
-            return """
+            yield """
 🔒 TRUST VALIDATION
 ----------------------------------------
 ❌ Trust validation not performed
 ⚠️ Reason: System not available or disabled
 """
+            return
+        
+        validation_details = trust_validation.get('validation_details') or {}
         
         # Check for errors
-        if trust_validation.get('validation_details', {}).get('error'):
-            error_msg = trust_validation['validation_details']['error']
-            return f"""
+        error_msg = validation_details.get('error')
+        if error_msg:
+            yield f"""
 🔒 TRUST VALIDATION
 ----------------------------------------
 ❌ Validation Error: {error_msg}
 📊 API Calls Used: {trust_validation.get('api_calls_used', 0)}
 """
+            return
         
         # Format successful validation
         is_validated = trust_validation.get('is_validated', False)
         trusted_count = trust_validation.get('trusted_follower_count', 0)
         min_required = trust_validation.get('min_required', 2)
         validation_strength = trust_validation.get('validation_strength', 0)
-        trust_score = trust_validation.get('trust_score', {})
-        trust_integration_score = trust_validation.get('trust_integration_score', {})
+        trust_score = trust_validation.get('trust_score') or {}
+        trust_integration_score = trust_validation.get('trust_integration_score') or {}
         
         status_emoji = "✅" if is_validated else "❌"
         status_text = "VALIDATED" if is_validated else "NOT VALIDATED"
         
-        output = f"""
+        yield f"""
 🔒 TRUST VALIDATION
 ----------------------------------------
 {status_emoji} Status: {status_text}
@@ -320,32 +466,40 @@ class TrustIntegratedAnalyzer:
         if trust_integration_score:
             integration_tier = trust_integration_score.get('integration_tier', 'Unknown')
             combined_metric = trust_integration_score.get('combined_metric', 0)
-            output += f"🔗 Integration Tier: {integration_tier}\n"
-            output += f"📊 Combined Trust Metric: {combined_metric:.3f}\n"
+            yield f"🔗 Integration Tier: {integration_tier}\n"
+            yield f"📊 Combined Trust Metric: {combined_metric:.3f}\n"
         
         # Show trusted followers (limited)
         trusted_followers = trust_validation.get('trusted_followers', [])
         if trusted_followers:
-            output += f"\n👥 Trusted Followers ({len(trusted_followers)}):\n"
-            for follower in trusted_followers[:5]:  # Show first 5
-                output += f"   └─ @{follower['username']} ({follower['category']})\n"
+            yield f"\n👥 Trusted Followers ({len(trusted_followers)}):\n"
+            yield from (  # Show first 5
+                "   └─ @%s (%s)\n" % (follower['username'], follower['category'])
+                for follower in trusted_followers[:5]
+            )
             
             if len(trusted_followers) > 5:
-                output += f"   └─ ... and {len(trusted_followers) - 5} more\n"
+                yield f"   └─ ... and {len(trusted_followers) - 5} more\n"
         
         # Show category breakdown
-        follower_categories = trust_validation.get('validation_details', {}).get('follower_categories', {})
+        follower_categories = validation_details.get('follower_categories', {})
         if follower_categories:
-            output += "\n📂 Categories:\n"
-            for category, count in sorted(follower_categories.items(), key=lambda x: x[1], reverse=True):
-                output += f"   └─ {category}: {count}\n"
+            yield "\n📂 Categories:\n"
+            yield from (  # Show top 10
+                "   └─ %s: %s\n" % (category, count)
+                for category, count in heapq.nlargest(10, follower_categories.items(), key=itemgetter(1))
+            )
         
         # Show validation stats
         api_calls = trust_validation.get('api_calls_used', 0)
-        checked_accounts = trust_validation.get('validation_details', {}).get('checked_accounts', 0)
-        output += f"\n📈 Stats: {checked_accounts:,} followers checked, {api_calls} API calls\n"
-        
-        return output
+        api_calls_label = f"{api_calls} API calls" + (" (cached)" if trust_validation.get('from_cache') else "")
+        checked_accounts = validation_details.get('checked_accounts', 0)
+        probed = validation_details.get('trusted_accounts_probed')
+        if probed is not None:
+            yield f"\n📈 Stats: {checked_accounts:,} followers covered via {probed} trusted account lookups, {api_calls_label}\n"
+        else:
+            yield f"\n📈 Stats: {checked_accounts:,} followers checked, {api_calls_label}\n"
+
     
     def get_trust_system_status(self) -> Dict[str, Any]:
         """Get comprehensive trust system status"""
@@ -354,7 +508,8 @@ class TrustIntegratedAnalyzer:
             'validator_available': self.trust_validator is not None,
             'min_trusted_followers': self.min_trusted_followers,
             'trust_boost_factor': self.trust_boost_factor,
-            'max_trust_api_calls': self.max_trust_api_calls
+            'max_trust_api_calls': self.max_trust_api_calls,
+            'max_follower_pages': self.max_follower_pages
         }
         
         if self.trust_validator:
@@ -371,21 +526,46 @@ class TrustIntegratedAnalyzer:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f"enhanced_analysis_{username}_{timestamp}.txt"
             
-            formatted_report = self.format_enhanced_analysis_report(analysis_results)
+            header = "".join((
+                "Enhanced Analysis Report with Trust Validation\n",
+                f"Generated: {analysis_results.get('timestamp') or datetime.now(timezone.utc).isoformat()}\n",
+                "=" * 80, "\n\n"
+            ))
             
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"Enhanced Analysis Report with Trust Validation\n")
-                f.write(f"Generated: {datetime.now(timezone.utc).isoformat()}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(formatted_report)
+                f.write(header)
+                f.writelines(self.iter_enhanced_analysis_report(analysis_results))
             
-            logger.info(f"💾 Enhanced analysis saved: {filename}")
+            logger.info("💾 Enhanced analysis saved: %s", filename)
             return True
             
         except Exception as e:
             logger.error(f"❌ Error saving enhanced analysis: {e}")
             return False
     
+    def save_enhanced_analysis_json(self, analysis_results: Dict[str, Any], filename: str = None) -> bool:
+        """Save raw enhanced analysis results as JSON (uses orjson when installed)"""
+        try:
+            if not filename:
+                username = analysis_results.get('username', 'unknown')
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filename = f"enhanced_analysis_{username}_{timestamp}.json"
+            
+            if orjson is not None:
+                payload = orjson.dumps(analysis_results, default=str, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(analysis_results, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+            
+            with open(filename, 'wb') as f:
+                f.write(payload)
+            
+            logger.info("💾 Enhanced analysis JSON saved: %s", filename)
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error saving enhanced analysis JSON: {e}")
+            return False
+    
     def quick_trust_check(self, user_id: str, username: str = None) -> Dict[str, Any]:
         """Perform a quick trust validation check"""
         try:
@@ -395,16 +575,12 @@ class TrustIntegratedAnalyzer:
                     'reason': 'Trust system not initialized'
                 }
             
-            logger.info(f"⚡ Quick trust check for user ID: {user_id}")
-            
-            # Perform validation with lower limits for quick check
-            original_max_calls = self.trust_validator.max_api_calls
-            self.trust_validator.max_api_calls = 5  # Limited for quick check
-            
-            validation_result = self.trust_validator.check_trusted_followers(user_id, 1)  # Lower threshold
+            logger.info("⚡ Quick trust check for user ID: %s", user_id)
             
-            # Restore original limit
-            self.trust_validator.max_api_calls = original_max_calls
+            # Perform validation with lower limits for quick check (a cached full result is reused)
+            validation_result = self.trust_validator.check_trusted_followers(
+                user_id, 1, max_calls=QUICK_CHECK_MAX_CALLS  # Lower threshold, limited budget
+            )
             
             # Format quick result
             quick_result = {
@@ -429,6 +605,11 @@ class TrustIntegratedAnalyzer:
                 'reason': f'Error: {str(e)}'
             }
 
+@functools.lru_cache(maxsize=256)
+def _format_trust_summary(trust_level: str, trusted_count: int) -> str:
+    """Format a validated trust summary line (few distinct inputs, so cached)"""
+    return f"🔒 Trust: ✅ {trust_level} ({trusted_count} trusted followers)"
+
 class TrustAwareReporting:
     """Enhanced reporting with trust-aware formatting"""
     
@@ -444,7 +625,7 @@ class TrustAwareReporting:
         trusted_count = trust_validation.get('trusted_follower_count', 0)
         trust_level = trust_score.get('trust_level', 'Unknown')
         
-        return f"🔒 Trust: ✅ {trust_level} ({trusted_count} trusted followers)"
+        return _format_trust_summary(trust_level, trusted_count)
     
     @staticmethod
     def format_trust_badge(validation_result: Dict[str, Any]) -> str:
@@ -455,12 +636,4 @@ class TrustAwareReporting:
         trust_score = validation_result.get('trust_score', {})
         trust_level = trust_score.get('trust_level', 'Unknown')
         
-        badges = {
-            'Highly Trusted': '🏆 Highly Trusted',
-            'Well Trusted': '⭐ Well Trusted',
-            'Moderately Trusted': '✅ Trusted',
-            'Lightly Trusted': '🔹 Verified',
-            'Minimally Trusted': '◾ Basic Trust'
-        }
-        
-        return badges.get(trust_level, '✅ Verified')
\ No newline at end of file
+        return TRUST_BADGES.get(trust_level, '✅ Verified')
\ No newline at end of file
@@ -13,29 +13,113 @@ Version: 1.0
 """
 
 import tweepy
+import copy
 import json
+import os
 import time
 import logging
+import math
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Set, Optional, Tuple, Any
 from collections import Counter
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional - the resolved-IDs cache stays JSON without it
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+# Quoted X handles (1-15 letters, digits or underscores) in the trust list source
+_USERNAME_RE = re.compile(r'"([A-Za-z0-9_]{1,15})"')
+
+# X API error code for endpoints outside the app's access tier
+_V1_ACCESS_DENIED_CODE = 453
+
+# Category weights for trust scoring (higher = more valuable)
+_CATEGORY_WEIGHTS = {
+    'Key Opinion Leader': 30,
+    'Infrastructure': 25,
+    'DeFi Protocol': 20,
+    'NFT/Gaming': 15,
+    'Gaming/Metaverse': 12,
+    'Media/Community': 10,
+    'Other': 5
+}
+_MAX_CATEGORY_WEIGHT = max(_CATEGORY_WEIGHTS.values())
+
+# Trust score for a target with no trusted followers
+_EMPTY_TRUST_SCORE = {
+    'overall_score': 0,
+    'category_scores': {},
+    'trust_level': 'Unverified',
+    'weighted_score': 0,
+    'max_possible': 0
+}
+
+@lru_cache(maxsize=1024)
+def _parse_cache_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO cache timestamp (memoized - the same entries are re-checked often)"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+@dataclass(slots=True)
+class TrustedFollower:
+    """A trusted account found among the target's followers"""
+    username: str
+    user_id: str
+    name: str
+    category: str
+
 class TrustedAccountValidator:
     """Validates account credibility using trusted account followers"""
     
     def __init__(self, api_client: tweepy.Client):
         self.client = api_client
         self.trust_list_url = "https://raw.githubusercontent.com/devsyrem/turst-list/main/list"
-        self.cache_file = "trust_system/trust_cache.json"
+        
+        # Keep-alive session for the trust list fetch, retrying transient gateway errors
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        
+        self.legacy_cache_file = "trust_system/trust_cache.json"
+        self.cache_file = "trust_system/trust_cache.msgpack" if msgpack is not None else self.legacy_cache_file
+        self.trust_list_cache_file = "trust_system/trust_list_cache.json"
         self.cache_duration = timedelta(hours=24)  # Cache for 24 hours
+        self.validation_cache_file = "trust_system/validation_cache.json"
+        self.validation_cache_duration = timedelta(hours=6)  # Per-target results
+        self.validation_cache_size = 256  # Oldest entries are evicted beyond this
+        self._validation_cache = None  # target_user_id -> result, loaded from disk on first use
+        self._validation_cache_lock = threading.Lock()
         self.trusted_accounts = []
         self.trusted_user_ids = {}  # username -> user_id mapping
+        self.trusted_id_set = frozenset()  # user_id set for follower intersection
         self.api_calls_made = 0
         self.max_api_calls = 50  # Limit for trust validation
+        self._api_calls_lock = threading.Lock()  # Shared budget across concurrent checks
+        self.batch_interval = 1.1  # Minimum seconds between username batch requests
+        self._batch_slot_lock = threading.Lock()
+        self._next_batch_slot = 0.0
+        self._friendship_api = None  # v1.1 handle for relationship and follower ID lookups
+        self._v1_api_unavailable = False  # Set once the access tier rejects v1.1 endpoints
+        self.max_concurrent_requests = 5  # In-flight validation requests across all threads
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrent_requests)
         
         # Category definitions for trusted accounts
         self.category_patterns = {
@@ -63,38 +147,18 @@ class TrustedAccountValidator:
                 'staratlas', 'grape', 'star', 'atlas', 'gaming', 'metaverse'
             ]
         }
+        self._build_category_matcher()
         
     def load_trusted_accounts(self) -> bool:
         """Load and parse trusted accounts from GitHub repository"""
         try:
-            logger.info("🔍 Fetching trusted accounts list from GitHub...")
-            response = requests.get(self.trust_list_url, timeout=30)
-            response.raise_for_status()
-            
             # Parse the Python list format
-            content = response.text
+            content = self._fetch_trust_list()
             logger.debug(f"📄 Raw content length: {len(content)} characters")
             
-            # Extract the list from the TRUSTED_ACCOUNTS variable
-            start_idx = content.find('[')
-            end_idx = content.rfind(']') + 1
-            
-            if start_idx == -1 or end_idx == -1:
-                logger.error("❌ Could not find list brackets in trusted accounts file")
-                return False
-            
-            list_content = content[start_idx:end_idx]
-            logger.debug(f"📋 Extracted list content: {len(list_content)} characters")
-            
-            # Extract usernames using regex to handle comments and formatting
-            usernames = re.findall(r'"([^"]+)"', list_content)
-            
-            # Clean and validate usernames
-            self.trusted_accounts = []
-            for username in usernames:
-                clean_username = username.strip()
-                if clean_username and len(clean_username) > 0:
-                    self.trusted_accounts.append(clean_username)
+            # One pass over the raw text: quoted strings shaped like X handles are the list
+            # entries, so no bracket search, slicing or cleanup pass is needed
+            self.trusted_accounts = _USERNAME_RE.findall(content)
             
             if not self.trusted_accounts:
                 logger.error("❌ No valid usernames found in trusted accounts list")
@@ -109,6 +173,7 @@ class TrustedAccountValidator:
             # Categorize accounts for better understanding
             category_counts = self._categorize_all_accounts()
             logger.info(f"📊 Categories: {dict(category_counts)}")
+            self._sort_keywords_by_hits()  # Common keywords first for later follower lookups
             
             return True
             
@@ -119,15 +184,41 @@ class TrustedAccountValidator:
             logger.error(f"❌ Error loading trusted accounts: {e}")
             return False
     
+    def _fetch_trust_list(self) -> str:
+        """Fetch the trust list, reusing the cached body when GitHub returns 304"""
+        cached_list = self._load_json_file(self.trust_list_cache_file)
+        
+        headers = {}
+        if cached_list and cached_list.get('body'):
+            if cached_list.get('etag'):
+                headers['If-None-Match'] = cached_list['etag']
+            if cached_list.get('last_modified'):
+                headers['If-Modified-Since'] = cached_list['last_modified']
+        
+        logger.info("🔍 Fetching trusted accounts list from GitHub...")
+        response = self._session.get(self.trust_list_url, headers=headers, timeout=(5, 30))
+        
+        if response.status_code == 304 and headers:
+            logger.info("📦 Trusted accounts list unchanged - using cached copy")
+            return cached_list['body']
+        
+        response.raise_for_status()
+        content = response.text
+        
+        self._save_json_file(self.trust_list_cache_file, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': content,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        })
+        
+        return content
+    
     def _categorize_all_accounts(self) -> Counter:
         """Categorize all trusted accounts and return counts"""
-        categories = Counter()
-        for account in self.trusted_accounts:
-            category = self._categorize_account(account)
-            categories[category] += 1
-        return categories
+        return Counter(map(self._categorize_account, self.trusted_accounts))
     
-    def resolve_usernames_to_ids(self, max_batch_size: int = 100) -> bool:
+    def resolve_usernames_to_ids(self, max_batch_size: int = 100, max_workers: int = 4) -> bool:
         """Convert usernames to user IDs using Twitter API"""
         try:
             logger.info("🔄 Resolving trusted account usernames to user IDs...")
@@ -135,64 +226,37 @@ class TrustedAccountValidator:
             # Check cache first
             cached_data = self._load_cache()
             if cached_data and self._is_cache_valid(cached_data):
-                self.trusted_user_ids = cached_data.get('user_ids', {})
+                self._set_trusted_user_ids(cached_data.get('user_ids', {}))
                 logger.info(f"📦 Loaded {len(self.trusted_user_ids)} user IDs from cache")
                 return len(self.trusted_user_ids) > 0
             
-            # Process in batches to respect API limits
+            # Resolve batches concurrently; request starts stay paced by batch_interval
+            batches = [
+                self.trusted_accounts[i:i + max_batch_size]
+                for i in range(0, len(self.trusted_accounts), max_batch_size)
+            ]
+            total_batches = len(batches)
             resolved_ids = {}
             failed_usernames = []
-            successful_batches = 0
-            
-            total_batches = (len(self.trusted_accounts) + max_batch_size - 1) // max_batch_size
             
-            for i in range(0, len(self.trusted_accounts), max_batch_size):
-                batch_num = (i // max_batch_size) + 1
-                batch = self.trusted_accounts[i:i + max_batch_size]
-                
-                try:
-                    logger.info(f"🔍 Processing batch {batch_num}/{total_batches} ({len(batch)} accounts)")
-                    
-                    # API call to get user IDs
-                    users = self.client.get_users(
-                        usernames=batch, 
-                        user_fields=['id', 'username', 'name']
-                    )
-                    self.api_calls_made += 1
-                    
-                    if users.data:
-                        for user in users.data:
-                            resolved_ids[user.username.lower()] = str(user.id)
-                        successful_batches += 1
-                        logger.info(f"✅ Resolved {len(users.data)} accounts in batch {batch_num}")
-                    
-                    # Track failed resolutions
-                    if users.errors:
-                        for error in users.errors:
-                            failed_username = error.get('value', 'unknown')
-                            failed_usernames.append(failed_username)
-                            logger.debug(f"⚠️ Failed to resolve: @{failed_username}")
-                    
-                    # Rate limit protection
-                    if batch_num < total_batches:
-                        time.sleep(1.1)  # Slightly over 1 second to be safe
-                    
-                except tweepy.TooManyRequests:
-                    logger.warning(f"⚠️ Rate limit hit at batch {batch_num}, waiting...")
-                    time.sleep(900)  # Wait 15 minutes
-                    continue
-                except Exception as e:
-                    logger.error(f"❌ Error resolving batch {batch_num}: {e}")
-                    failed_usernames.extend(batch)
-                    continue
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._resolve_batch, batch, batch_num, total_batches)
+                    for batch_num, batch in enumerate(batches, 1)
+                ]
+                for future in as_completed(futures):
+                    batch_ids, batch_failed = future.result()
+                    resolved_ids.update(batch_ids)
+                    failed_usernames.extend(batch_failed)
             
-            self.trusted_user_ids = resolved_ids
+            self._set_trusted_user_ids(resolved_ids)
             
             # Save to cache
             cache_data = {
                 'user_ids': resolved_ids,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'failed_usernames': failed_usernames,
+                'trusted_accounts': self.trusted_accounts,
                 'total_accounts': len(self.trusted_accounts),
                 'successful_resolutions': len(resolved_ids)
             }
@@ -210,13 +274,90 @@ class TrustedAccountValidator:
             logger.error(f"❌ Error resolving usernames to IDs: {e}")
             return False
     
-    def check_trusted_followers(self, target_user_id: str, min_trusted_followers: int = 2) -> Dict[str, Any]:
+    def _resolve_batch(self, batch: List[str], batch_num: int, total_batches: int,
+                       max_retries: int = 3) -> Tuple[Dict[str, str], List[str]]:
+        """Resolve one batch of usernames, backing off on rate limits; returns (ids, failed)"""
+        resolved_ids = {}
+        failed_usernames = []
+        
+        for attempt in range(max_retries + 1):
+            self._wait_for_batch_slot()
+            try:
+                logger.info(f"🔍 Processing batch {batch_num}/{total_batches} ({len(batch)} accounts)")
+                
+                # API call to get user IDs
+                users = self.client.get_users(
+                    usernames=batch, 
+                    user_fields=['id', 'username', 'name']
+                )
+                self._record_api_call()
+                
+                if users.data:
+                    for user in users.data:
+                        resolved_ids[user.username.lower()] = str(user.id)
+                    logger.info(f"✅ Resolved {len(users.data)} accounts in batch {batch_num}")
+                
+                # Track failed resolutions
+                if users.errors:
+                    for error in users.errors:
+                        failed_username = error.get('value', 'unknown')
+                        failed_usernames.append(failed_username)
+                        logger.debug(f"⚠️ Failed to resolve: @{failed_username}")
+                
+                return resolved_ids, failed_usernames
+                
+            except tweepy.TooManyRequests:
+                if attempt == max_retries:
+                    break
+                backoff = 60 * 2 ** attempt
+                logger.warning(f"⚠️ Rate limit hit at batch {batch_num}, retrying in {backoff}s...")
+                time.sleep(backoff)  # Only this worker waits
+            except Exception as e:
+                logger.error(f"❌ Error resolving batch {batch_num}: {e}")
+                break
+        
+        return resolved_ids, failed_usernames + list(batch)
+    
+    def _wait_for_batch_slot(self) -> None:
+        """Block until this thread may start the next batch request (one per batch_interval)"""
+        with self._batch_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_batch_slot)
+            self._next_batch_slot = slot + self.batch_interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _record_api_call(self) -> bool:
+        """Count one API call against the shared budget; returns True if budget remains"""
+        with self._api_calls_lock:
+            self.api_calls_made += 1
+            return self.api_calls_made < self.max_api_calls
+    
+    def _charge_api_call(self, validation_details: Dict[str, Any]) -> bool:
+        """Count one call against the shared budget and this check's own; returns True if both have room"""
+        budget_left = self._record_api_call()
+        validation_details['api_calls_made'] += 1
+        call_budget = validation_details.get('call_budget')
+        return budget_left and (call_budget is None or validation_details['api_calls_made'] < call_budget)
+    
+    def _set_trusted_user_ids(self, user_ids: Dict[str, str]) -> None:
+        """Store resolved user IDs and rebuild the ID lookup set"""
+        self.trusted_user_ids = user_ids
+        self.trusted_id_set = frozenset(user_ids.values())
+    
+    def check_trusted_followers(self, target_user_id: str, min_trusted_followers: int = 2,
+                                max_pages: int = 1, follower_count: Optional[int] = None,
+                                max_calls: Optional[int] = None) -> Dict[str, Any]:
         """
         Check if target user is followed by trusted accounts
         
         Args:
             target_user_id: Twitter user ID to check
             min_trusted_followers: Minimum trusted followers for positive validation
+            max_pages: Follower pages (1000 followers, one API call each) to scan
+            follower_count: Target's follower count, if known, used to pick the cheaper strategy
+            max_calls: Optional API call budget for this check alone (the lifetime cap still applies)
             
         Returns:
             Dict with validation results and detailed metrics
@@ -224,6 +365,11 @@ class TrustedAccountValidator:
         try:
             logger.info(f"🔍 Starting trusted followers check for user ID: {target_user_id}")
             
+            cached_result = self._get_cached_validation(target_user_id, min_trusted_followers, max_pages)
+            if cached_result:
+                logger.info(f"📦 Using cached trust validation for user ID: {target_user_id}")
+                return cached_result
+            
             if not self.trusted_user_ids:
                 logger.warning("⚠️ No trusted user IDs available - attempting resolution...")
                 if not self.resolve_usernames_to_ids():
@@ -239,52 +385,48 @@ class TrustedAccountValidator:
                 'checked_accounts': 0,
                 'api_calls_made': 0,
                 'trusted_followers_found': [],
-                'follower_categories': {},
+                'follower_categories': Counter(),
                 'validation_strength': 0,
-                'check_method': 'follower_lookup'
+                'check_method': 'follower_lookup',
+                'pages_requested': max_pages,
+                'call_budget': max_calls,
+                'scan_complete': False,   # Every follower (or trusted account) was examined
+                'scan_truncated': False   # Stopped early on hits or budget before max_pages
             }
             
-            # Strategy: Check target user's followers for trusted accounts
-            # This is more efficient than checking each trusted account individually
+            # Strategy: Check target user's followers for trusted accounts. When the
+            # trust list is smaller than a full follower scan, ask per trusted account instead
             try:
-                logger.info("📋 Fetching target user's followers...")
+                trusted_hits = None
+                if self._prefer_friendship_check(follower_count, max_calls):
+                    trusted_hits = self._check_via_friendships(target_user_id, validation_details)
                 
-                # Get followers of target user (paginated)
-                followers_checked = 0
-                max_followers_to_check = 1000  # Reasonable limit
+                if trusted_hits is None:
+                    # IDs-only pages cover 5x the followers per call; full pages are the fallback
+                    enough_hits = min_trusted_followers * 2  # Plenty of signal for scoring
+                    scan = self._scan_follower_ids(target_user_id, max_pages, validation_details, enough_hits)
+                    if scan is None:
+                        scan = self._scan_followers(target_user_id, max_pages, validation_details, enough_hits)
+                    followers_checked, trusted_hits = scan
+                else:
+                    # Each trusted account was asked directly, so the whole follower base is covered;
+                    # report it in followers so trust density stays comparable with the scans
+                    validation_details['trusted_accounts_probed'] = validation_details['api_calls_made']
+                    followers_checked = follower_count
                 
-                for followers_page in tweepy.Paginator(
-                    self.client.get_users_followers,
-                    id=target_user_id,
-                    max_results=1000,
-                    limit=1  # Only check first 1000 followers for efficiency
-                ).flatten(limit=max_followers_to_check):
-                    
-                    self.api_calls_made += 1
-                    validation_details['api_calls_made'] += 1
-                    
-                    if self.api_calls_made >= self.max_api_calls:
-                        logger.warning("⚠️ API limit reached during follower check")
-                        break
+                categorize = self._categorize_account
+                
+                for follower_id, follower_username, follower_name in trusted_hits:
+                    logger.info(f"✅ Found trusted follower: @{follower_username}")
                     
-                    if followers_page:
-                        followers_checked += 1
-                        follower_username = followers_page.username.lower()
-                        
-                        # Check if this follower is in our trusted list
-                        if follower_username in self.trusted_user_ids:
-                            logger.info(f"✅ Found trusted follower: @{followers_page.username}")
-                            
-                            trusted_followers.append({
-                                'username': followers_page.username,
-                                'user_id': str(followers_page.id),
-                                'name': getattr(followers_page, 'name', ''),
-                                'category': self._categorize_account(followers_page.username)
-                            })
-                            
-                            category = self._categorize_account(followers_page.username)
-                            validation_details['follower_categories'][category] = \
-                                validation_details['follower_categories'].get(category, 0) + 1
+                    category = categorize(follower_username)
+                    trusted_followers.append(TrustedFollower(
+                        username=follower_username,
+                        user_id=follower_id,
+                        name=follower_name,
+                        category=category
+                    ))
+                    validation_details['follower_categories'][category] += 1
                 
                 validation_details['checked_accounts'] = followers_checked
                 logger.info(f"📊 Checked {followers_checked} followers, found {len(trusted_followers)} trusted")
@@ -310,7 +452,7 @@ class TrustedAccountValidator:
             )
             
             validation_details.update({
-                'trusted_followers_found': [f"@{tf['username']}" for tf in trusted_followers],
+                'trusted_followers_found': [f"@{tf.username}" for tf in trusted_followers],
                 'validation_strength': validation_strength
             })
             
@@ -322,7 +464,7 @@ class TrustedAccountValidator:
                 'trusted_follower_count': trusted_follower_count,
                 'min_required': min_trusted_followers,
                 'validation_strength': validation_strength,
-                'trusted_followers': trusted_followers,
+                'trusted_followers': [asdict(tf) for tf in trusted_followers],  # Plain dicts for callers/JSON
                 'validation_details': validation_details,
                 'trust_score': trust_score,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
@@ -332,12 +474,279 @@ class TrustedAccountValidator:
             status = "✅ VALIDATED" if is_validated else "❌ NOT VALIDATED"
             logger.info(f"🎯 Trust validation complete: {trusted_follower_count} trusted followers → {status}")
             
+            self._store_validation(target_user_id, result)
+            
             return result
             
         except Exception as e:
             logger.error(f"❌ Error in trusted followers check: {e}")
             return self._empty_validation_result(f"Validation error: {str(e)}")
     
+    def check_trusted_followers_many(self, target_user_ids: List[str], min_trusted_followers: int = 2,
+                                     max_pages: int = 1, max_workers: int = 5) -> Dict[str, Dict[str, Any]]:
+        """
+        Check several targets concurrently, sharing the API budget and request slots
+        
+        Args:
+            target_user_ids: Twitter user IDs to check (duplicates are checked once)
+            min_trusted_followers: Minimum trusted followers for positive validation
+            max_pages: Follower pages to scan per target
+            max_workers: Targets validated at the same time
+            
+        Returns:
+            Dict mapping each target user ID to its validation result
+        """
+        unique_ids = list(dict.fromkeys(map(str, target_user_ids)))
+        
+        # Resolve once up front so the workers don't all race to do it
+        if unique_ids and not self.trusted_user_ids:
+            self.resolve_usernames_to_ids()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda user_id: self.check_trusted_followers(user_id, min_trusted_followers, max_pages),
+                unique_ids
+            )
+            return dict(zip(unique_ids, results))
+    
+    def _get_cached_validation(self, target_user_id: str, min_trusted_followers: int,
+                               max_pages: int = 1) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached result at least as deep as the request, or None"""
+        with self._validation_cache_lock:
+            cache = self._load_validation_cache()
+            cached_result = cache.get(target_user_id)
+            if not cached_result:
+                return None
+            
+            if not self._is_cache_valid(cached_result, self.validation_cache_duration):
+                del cache[target_user_id]
+                return None
+            
+            # A shallower scan can't answer a deeper request - leave it for the new scan to replace
+            details = cached_result.get('validation_details', {})
+            if not (details.get('scan_complete') or details.get('pages_requested', 0) >= max_pages):
+                return None
+            
+            result = copy.deepcopy(cached_result)
+        
+        # Threshold is applied per call; the follower data itself is what is cached
+        result['min_required'] = min_trusted_followers
+        result['is_validated'] = result.get('trusted_follower_count', 0) >= min_trusted_followers
+        result['from_cache'] = True  # api_calls_used stays the scan's own count, which reliability scoring relies on
+        return result
+    
+    def _store_validation(self, target_user_id: str, result: Dict[str, Any]) -> None:
+        """Cache a completed validation in memory and persist the unexpired entries"""
+        if result['validation_details'].get('scan_truncated'):
+            return  # Depends on hits/budget at the time - not reusable for other requests
+        
+        with self._validation_cache_lock:
+            cache = self._load_validation_cache()
+            cache.pop(target_user_id, None)  # Re-insert so insertion order tracks recency
+            cache[target_user_id] = copy.deepcopy(result)
+            
+            now = datetime.now(timezone.utc)
+            for user_id in [uid for uid, entry in cache.items()
+                            if not self._is_cache_valid(entry, self.validation_cache_duration, now)]:
+                del cache[user_id]
+            
+            while len(cache) > self.validation_cache_size:
+                del cache[next(iter(cache))]
+            
+            self._save_json_file(self.validation_cache_file, cache)
+    
+    def _load_validation_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Per-target validation cache, read from disk the first time it is needed"""
+        if self._validation_cache is None:
+            self._validation_cache = self._load_json_file(self.validation_cache_file) or {}
+        return self._validation_cache
+    
+    def _scan_followers(self, target_user_id: str, max_pages: int, validation_details: Dict[str, Any],
+                        enough_hits: int = 0) -> Tuple[int, List[Tuple[str, str, str]]]:
+        """Page through the target's followers; returns (followers checked, trusted hits)"""
+        logger.info("📋 Fetching target user's followers...")
+        
+        followers_checked = 0
+        trusted_hits = []
+        trusted_id_set = self.trusted_id_set
+        next_token = None
+        
+        # Cursor manually (one API call per page) so we can stop once the result is clear
+        for page in range(max_pages):
+            with self._request_slots:
+                response = self.client.get_users_followers(
+                    id=target_user_id,
+                    max_results=1000,
+                    pagination_token=next_token,
+                    user_fields=['username']  # Never ask for optional fields on bulk follower pages
+                )
+            budget_left = self._charge_api_call(validation_details)
+            
+            for follower in response.data or ():
+                followers_checked += 1
+                follower_id = str(follower.id)
+                if follower_id in trusted_id_set:
+                    trusted_hits.append((follower_id, follower.username, getattr(follower, 'name', '')))
+            
+            next_token = (response.meta or {}).get('next_token')
+            if not next_token:
+                validation_details['scan_complete'] = True
+                break
+            
+            if page == max_pages - 1:
+                break
+            
+            if enough_hits and len(trusted_hits) >= enough_hits:
+                logger.debug(f"⏭️ Found {len(trusted_hits)} trusted followers - skipping remaining pages")
+                validation_details['scan_truncated'] = True
+                break
+            
+            if not budget_left:
+                logger.warning("⚠️ API limit reached during follower check")
+                validation_details['scan_truncated'] = True
+                break
+        
+        return followers_checked, trusted_hits
+    
+    def _scan_follower_ids(self, target_user_id: str, max_pages: int, validation_details: Dict[str, Any],
+                           enough_hits: int = 0) -> Optional[Tuple[int, List[Tuple[str, str, str]]]]:
+        """Page through follower IDs and hydrate only the trusted matches; None if unavailable"""
+        api = self._get_friendship_api()
+        if api is None:
+            return None
+        
+        logger.info("📋 Fetching target user's follower IDs...")
+        validation_details['check_method'] = 'follower_ids_lookup'
+        
+        followers_checked = 0
+        matched_ids = []
+        cursor = -1
+        
+        try:
+            for page in range(max_pages):
+                with self._request_slots:
+                    follower_ids, (_, cursor) = api.get_follower_ids(
+                        user_id=target_user_id,
+                        cursor=cursor,
+                        count=5000,
+                        stringify_ids=True
+                    )
+                budget_left = self._charge_api_call(validation_details)
+                
+                followers_checked += len(follower_ids)
+                matched_ids.extend(self.trusted_id_set.intersection(follower_ids))
+                
+                if not cursor:
+                    validation_details['scan_complete'] = True
+                    break
+                
+                if page == max_pages - 1:
+                    break
+                
+                if enough_hits and len(matched_ids) >= enough_hits:
+                    validation_details['scan_truncated'] = True
+                    break
+                
+                if not budget_left:
+                    logger.warning("⚠️ API limit reached during follower IDs check")
+                    validation_details['scan_truncated'] = True
+                    break
+        except (tweepy.Forbidden, tweepy.Unauthorized) as e:
+            # Endpoint not available on this access tier (or protected target) - use full pages
+            self._note_v1_access_error(e)
+            logger.warning(f"⚠️ Follower IDs lookup unavailable ({e}) - fetching follower pages instead")
+            validation_details['check_method'] = 'follower_lookup'
+            return None
+        
+        # Only the matches are hydrated into user objects (100 per lookup call)
+        trusted_hits = []
+        for i in range(0, len(matched_ids), 100):
+            if not budget_left:
+                logger.warning("⚠️ API limit reached before hydrating all trusted matches")
+                validation_details['scan_truncated'] = True
+                break
+            
+            with self._request_slots:
+                users = self.client.get_users(ids=matched_ids[i:i + 100], user_fields=['username'])
+            budget_left = self._charge_api_call(validation_details)
+            
+            for user in users.data or ():
+                trusted_hits.append((str(user.id), user.username, getattr(user, 'name', '')))
+        
+        return followers_checked, trusted_hits
+    
+    def _prefer_friendship_check(self, follower_count: Optional[int], max_calls: Optional[int] = None) -> bool:
+        """True when checking each trusted account costs fewer calls than a full follower scan"""
+        if not follower_count:
+            return False
+        
+        friendship_calls = len(self.trusted_id_set)
+        follower_pages = math.ceil(follower_count / 1000)
+        calls_available = self.max_api_calls - self.api_calls_made
+        if max_calls is not None:
+            calls_available = min(calls_available, max_calls)
+        return friendship_calls < follower_pages and friendship_calls <= calls_available
+    
+    def _check_via_friendships(self, target_user_id: str,
+                               validation_details: Dict[str, Any]) -> Optional[List[Tuple[str, str, str]]]:
+        """Ask whether each trusted account follows the target; None if the endpoint is unavailable"""
+        api = self._get_friendship_api()
+        if api is None:
+            return None
+        
+        logger.info("📋 Checking trusted accounts' relationship to target...")
+        validation_details['check_method'] = 'friendship_lookup'
+        trusted_hits = []
+        
+        try:
+            remaining = len(self.trusted_user_ids)
+            for username, user_id in self.trusted_user_ids.items():
+                remaining -= 1
+                with self._request_slots:
+                    source, _ = api.get_friendship(source_id=user_id, target_id=target_user_id)
+                budget_left = self._charge_api_call(validation_details)
+                
+                if source.following:
+                    trusted_hits.append((user_id, username, ''))
+                
+                if not budget_left and remaining:
+                    logger.warning("⚠️ API limit reached during friendship check")
+                    validation_details['scan_truncated'] = True
+                    break
+            else:
+                validation_details['scan_complete'] = True
+        except (tweepy.Forbidden, tweepy.Unauthorized) as e:
+            # Endpoint not available on this access tier - fall back to the follower scan
+            self._note_v1_access_error(e)
+            logger.warning(f"⚠️ Friendship lookup unavailable ({e}) - scanning followers instead")
+            validation_details['check_method'] = 'follower_lookup'
+            return None
+        
+        return trusted_hits
+    
+    def _note_v1_access_error(self, error: Exception) -> None:
+        """Stop trying v1.1 endpoints once the access tier is known to reject them"""
+        if _V1_ACCESS_DENIED_CODE in getattr(error, 'api_codes', ()):
+            logger.info("ℹ️ v1.1 endpoints not available on this access tier - using v2 only from now on")
+            self._v1_api_unavailable = True
+    
+    def _get_friendship_api(self) -> Optional[tweepy.API]:
+        """Build (once) a v1.1 API handle from the client's user credentials"""
+        if self._v1_api_unavailable:
+            return None
+        
+        if self._friendship_api is None:
+            credentials = (
+                getattr(self.client, 'consumer_key', None),
+                getattr(self.client, 'consumer_secret', None),
+                getattr(self.client, 'access_token', None),
+                getattr(self.client, 'access_token_secret', None)
+            )
+            if not all(credentials):
+                return None
+            self._friendship_api = tweepy.API(tweepy.OAuth1UserHandler(*credentials), wait_on_rate_limit=True)
+        return self._friendship_api
+    
     def _calculate_validation_strength(self, follower_count: int, categories: Dict[str, int]) -> int:
         """Calculate validation strength score (0-100)"""
         if follower_count == 0:
@@ -360,52 +769,84 @@ class TrustedAccountValidator:
         total_score = min(base_score + diversity_bonus + high_value_bonus, 100)
         return int(total_score)
     
+    def _build_category_matcher(self) -> None:
+        """Compile all category keywords into a single-pass matcher"""
+        # (keyword, category) pairs flattened once, in category priority order
+        self._flat_keywords = [
+            (keyword.lower(), category)
+            for category, keywords in self.category_patterns.items()
+            for keyword in keywords
+        ]
+        self._keyword_priority = {}  # keyword -> (rank, category) of its first occurrence
+        for rank, (keyword, category) in enumerate(self._flat_keywords):
+            self._keyword_priority.setdefault(keyword, (rank, category))
+        
+        self._category_re = self._compile_keyword_scan(list(self._keyword_priority))
+        self._category_cache = {}  # username -> category
+        self._keyword_hits = Counter()  # winning keyword -> usernames it categorized
+    
+    @staticmethod
+    def _compile_keyword_scan(keywords: List[str]) -> re.Pattern:
+        """Compile keywords (tried in the given order at each position) into one scan"""
+        # Zero-width lookahead reports a hit at every position, so overlapping keywords are not lost
+        alternation = '|'.join(map(re.escape, keywords))
+        return re.compile(f'(?=({alternation}))')
+    
+    def _sort_keywords_by_hits(self) -> None:
+        """Recompile the matcher so the most frequently winning keywords are tried first"""
+        # Keywords where one starts with another can hit at the same position, and the regex
+        # keeps only the first alternative there - group them and keep each group in priority order
+        groups = []
+        for keyword in sorted(self._keyword_priority, key=len):
+            group = next((g for g in groups if any(keyword.startswith(member) for member in g)), None)
+            if group is None:
+                groups.append([keyword])
+            else:
+                group.append(keyword)
+        
+        groups.sort(key=lambda g: sum(self._keyword_hits[keyword] for keyword in g), reverse=True)
+        ordered = [keyword for g in groups for keyword in sorted(g, key=self._keyword_priority.__getitem__)]
+        self._category_re = self._compile_keyword_scan(ordered)
+    
     def _categorize_account(self, username: str) -> str:
         """Categorize trusted account by username patterns"""
-        username_lower = username.lower()
+        category = self._category_cache.get(username)
+        if category is not None:
+            return category
         
-        # Check each category
-        for category, keywords in self.category_patterns.items():
-            if any(keyword in username_lower for keyword in keywords):
-                return category
+        best_keyword = min(
+            (m.group(1) for m in self._category_re.finditer(username.lower())),
+            key=self._keyword_priority.__getitem__,
+            default=None
+        )
+        if best_keyword is None:
+            category = "Other"
+        else:
+            category = self._keyword_priority[best_keyword][1]
+            self._keyword_hits[best_keyword] += 1
         
-        return "Other"
+        self._category_cache[username] = category
+        return category
     
-    def _calculate_trust_score(self, trusted_followers: List[Dict], validation_details: Dict) -> Dict[str, Any]:
+    def _calculate_trust_score(self, trusted_followers: List[TrustedFollower], validation_details: Dict) -> Dict[str, Any]:
         """Calculate detailed trust score based on follower analysis"""
         
         if not trusted_followers:
-            return {
-                'overall_score': 0,
-                'category_scores': {},
-                'trust_level': 'Unverified',
-                'weighted_score': 0
-            }
-        
-        # Category weights (higher = more valuable)
-        category_weights = {
-            'Key Opinion Leader': 30,
-            'Infrastructure': 25,
-            'DeFi Protocol': 20,
-            'NFT/Gaming': 15,
-            'Gaming/Metaverse': 12,
-            'Media/Community': 10,
-            'Other': 5
-        }
+            return {**_EMPTY_TRUST_SCORE, 'category_scores': {}}  # Fresh copy - callers may mutate
         
         # Calculate weighted score
         total_weighted_score = 0
-        category_scores = {}
+        category_scores = Counter()
         
         for follower in trusted_followers:
-            category = follower['category']
-            weight = category_weights.get(category, 5)
+            category = follower.category
+            weight = _CATEGORY_WEIGHTS.get(category, 5)
             total_weighted_score += weight
-            category_scores[category] = category_scores.get(category, 0) + weight
+            category_scores[category] += weight
         
         # Normalize to 0-100 scale
         # Max theoretical score for this number of followers
-        max_possible_score = len(trusted_followers) * max(category_weights.values())
+        max_possible_score = len(trusted_followers) * _MAX_CATEGORY_WEIGHT
         normalized_score = min((total_weighted_score / max_possible_score) * 100, 100) if max_possible_score > 0 else 0
         
         # Determine trust level
@@ -430,37 +871,83 @@ class TrustedAccountValidator:
     
     def _load_cache(self) -> Optional[Dict]:
         """Load cached trusted account data"""
+        if not self._cache_is_binary():
+            return self._load_json_file(self.cache_file)
+        
         try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.cache_file, 'rb') as f:
+                return msgpack.unpackb(f.read(), raw=False)
+        except FileNotFoundError:
+            # One-time migration - the next save rewrites it in the binary format
+            return self._load_json_file(self.legacy_cache_file)
+        except (ValueError, msgpack.exceptions.UnpackException):
             return None
     
+    def _cache_is_binary(self) -> bool:
+        """True when the resolved-IDs cache is stored as msgpack"""
+        return msgpack is not None and not self.cache_file.endswith('.json')
+    
     def _save_cache(self, data: Dict) -> bool:
         """Save trusted account data to cache"""
+        if not self._cache_is_binary():
+            saved = self._save_json_file(self.cache_file, data)
+        else:
+            saved = self._write_cache_file(self.cache_file, data, lambda d: msgpack.packb(d, use_bin_type=True))
+        
+        if saved:
+            logger.debug(f"💾 Cache saved: {len(data.get('user_ids', {}))} user IDs")
+            return True
+        return False
+    
+    def _load_json_file(self, path: str) -> Optional[Dict]:
+        """Load a JSON cache file, returning None if missing or corrupt"""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _save_json_file(self, path: str, data: Dict) -> bool:
+        """Write a JSON cache file atomically"""
+        return self._write_cache_file(path, data, self._encode_json)
+    
+    @staticmethod
+    def _encode_json(data: Dict) -> bytes:
+        """Encode cache data as indented JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode('utf-8')
+    
+    def _write_cache_file(self, path: str, data: Dict, encode) -> bool:
+        """Encode data and write it atomically to a cache file"""
         try:
             # Ensure directory exists
-            import os
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
             
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"💾 Cache saved: {len(data.get('user_ids', {}))} user IDs")
+            payload = encode(data)
+            
+            # Write to a temp file and rename so readers never see a partial cache
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
             return True
         except Exception as e:
-            logger.error(f"❌ Error saving cache: {e}")
+            logger.error(f"❌ Error saving cache {path}: {e}")
             return False
     
-    def _is_cache_valid(self, cached_data: Dict) -> bool:
-        """Check if cached data is still valid"""
+    def _is_cache_valid(self, cached_data: Dict, max_age: Optional[timedelta] = None,
+                        now: Optional[datetime] = None) -> bool:
+        """Check if cached data is still valid (defaults to the trusted-accounts cache duration)"""
         try:
             cache_timestamp = cached_data.get('timestamp')
             if not cache_timestamp:
                 return False
             
-            cache_time = datetime.fromisoformat(cache_timestamp.replace('Z', '+00:00'))
-            age = datetime.now(timezone.utc) - cache_time
-            is_valid = age < self.cache_duration
+            cache_time = _parse_cache_timestamp(cache_timestamp)
+            age = (now or datetime.now(timezone.utc)) - cache_time
+            is_valid = age < (max_age or self.cache_duration)
             
             if is_valid:
                 logger.debug(f"📦 Cache is valid (age: {age})")
@@ -523,7 +1010,7 @@ class TrustedAccountValidator:
         status_emoji = "✅" if is_validated else "❌"
         status_text = "VALIDATED" if is_validated else "NOT VALIDATED"
         
-        output = f"""
+        parts = [f"""
 🔒 TRUSTED ACCOUNT VALIDATION - @{username}
 ========================================
 {status_emoji} Status: {status_text}
@@ -531,36 +1018,46 @@ class TrustedAccountValidator:
 💪 Validation Strength: {validation_strength}/100
 🏆 Trust Level: {trust_score.get('trust_level', 'Unknown')}
 ⭐ Trust Score: {trust_score.get('overall_score', 0)}/100
-"""
+"""]
         
         # Show trusted followers if any found
         trusted_followers = validation_result.get('trusted_followers', [])
         if trusted_followers:
-            output += "\n👥 TRUSTED FOLLOWERS FOUND:\n"
-            for follower in trusted_followers[:10]:  # Show first 10
-                output += f"   └─ @{follower['username']} ({follower['category']})\n"
+            parts.append("\n👥 TRUSTED FOLLOWERS FOUND:\n")
+            parts.extend(
+                f"   └─ @{follower['username']} ({follower['category']})\n"
+                for follower in trusted_followers[:10]  # Show first 10
+            )
             
             if len(trusted_followers) > 10:
-                output += f"   └─ ... and {len(trusted_followers) - 10} more\n"
+                parts.append(f"   └─ ... and {len(trusted_followers) - 10} more\n")
         
         # Show category breakdown
-        follower_categories = validation_result.get('validation_details', {}).get('follower_categories', {})
+        validation_details = validation_result.get('validation_details', {})
+        follower_categories = validation_details.get('follower_categories', {})
         if follower_categories:
-            output += "\n📊 CATEGORY BREAKDOWN:\n"
-            for category, count in sorted(follower_categories.items(), key=lambda x: x[1], reverse=True):
-                output += f"   └─ {category}: {count} follower{'s' if count != 1 else ''}\n"
+            parts.append("\n📊 CATEGORY BREAKDOWN:\n")
+            parts.extend(
+                f"   └─ {category}: {count} follower{'s' if count != 1 else ''}\n"
+                for category, count in sorted(follower_categories.items(), key=lambda x: x[1], reverse=True)
+            )
         
         # Show validation stats
-        validation_details = validation_result.get('validation_details', {})
         api_calls = validation_result.get('api_calls_used', 0)
         checked_accounts = validation_details.get('checked_accounts', 0)
+        probed = validation_details.get('trusted_accounts_probed')
         
-        output += f"\n📈 Validation Stats:\n"
-        output += f"   └─ Followers checked: {checked_accounts:,}\n"
-        output += f"   └─ API calls used: {api_calls}\n"
-        output += f"   └─ Check method: {validation_details.get('check_method', 'unknown')}\n"
+        parts.append("\n📈 Validation Stats:\n")
+        if probed is not None:
+            parts.append(f"   └─ Followers covered: {checked_accounts:,} ({probed} trusted accounts probed)\n")
+        else:
+            parts.append(f"   └─ Followers checked: {checked_accounts:,}\n")
+        parts.append(
+            f"   └─ API calls used: {api_calls}{' (cached)' if validation_result.get('from_cache') else ''}\n"
+            f"   └─ Check method: {validation_details.get('check_method', 'unknown')}\n"
+        )
         
-        return output
+        return "".join(parts)
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status and statistics"""
@@ -590,6 +1087,16 @@ class TrustedAccountValidator:
         try:
             logger.info("🚀 Initializing Trusted Account Validation System...")
             
+            # Warm start: a fresh resolved-IDs cache makes the GitHub fetch and parse unnecessary
+            cached_data = self._load_cache()
+            if cached_data and cached_data.get('user_ids') and self._is_cache_valid(cached_data):
+                self._set_trusted_user_ids(cached_data['user_ids'])
+                self.trusted_accounts = cached_data.get('trusted_accounts') or list(self.trusted_user_ids)
+                self._categorize_all_accounts()
+                self._sort_keywords_by_hits()  # Same matcher ordering as a cold start
+                logger.info(f"📦 Trusted account system restored from cache: {len(self.trusted_user_ids)} user IDs")
+                return True
+            
             # Step 1: Load trusted accounts list
             if not self.load_trusted_accounts():
                 logger.error("❌ Failed to load trusted accounts list")